@@ -1,14 +1,21 @@
 # src/rhosocial/activerecord/backend/impl/mysql/adapters.py
 import datetime
 import json
+import sys
 import uuid
+from array import array
 from decimal import Decimal
 from enum import Enum
+from operator import methodcaller
 from typing import Any, Dict, List, Tuple, Type, Union, Optional
 from datetime import timedelta
 
 from rhosocial.activerecord.backend.type_adapter import SQLTypeAdapter
 
+# json.dumps() builds a fresh JSONEncoder on every call when any option differs
+# from the defaults, so keep one non-ASCII-escaping encoder for JSON writes.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 class MySQLBlobAdapter(SQLTypeAdapter):
     """
@@ -43,13 +50,16 @@ class MySQLJSONAdapter(SQLTypeAdapter):
         if value is None:
             return None
         # MySQL JSON type often stores as TEXT, so we serialize to string
-        return json.dumps(value, ensure_ascii=False)
+        return _JSON_ENCODER.encode(value)
 
     def from_database(
         self, value: Any, target_type: Type, options: Optional[Dict[str, Any]] = None
     ) -> Optional[Union[dict, list]]:
         if value is None:
             return None
+        # Drivers almost always hand back the raw JSON text; check that by identity first
+        if type(value) is str:
+            return json.loads(value)
         # MySQL connector might return str for JSON, or already dict/list for some drivers
         if isinstance(value, (dict, list)):
             return value
@@ -196,6 +206,12 @@ class MySQLDatetimeAdapter(SQLTypeAdapter):
                            If None, defaults to (8, 0, 0).
         """
         self._mysql_version = mysql_version or (8, 0, 0)
+        # MySQL 5.7.8+ supports ISO 8601 format, older versions need traditional format.
+        # The version never changes, so pick the formatter once.
+        if self._mysql_version >= (5, 7, 8):
+            self._format_utc = methodcaller('isoformat')
+        else:
+            self._format_utc = methodcaller('strftime', '%Y-%m-%d %H:%M:%S.%f')
 
     @property
     def supported_types(self) -> Dict[Type, List[Any]]:
@@ -208,11 +224,7 @@ class MySQLDatetimeAdapter(SQLTypeAdapter):
         # for the database driver, which expects naive datetimes.
         if value.tzinfo is not None:
             utc_dt = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
-            # MySQL 5.7.8+ supports ISO 8601 format, older versions need traditional format
-            if self._mysql_version >= (5, 7, 8):
-                return utc_dt.isoformat()
-            else:
-                return utc_dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+            return self._format_utc(utc_dt)
         # If it's already naive, assume it's in the desired timezone (conventionally UTC)
         return value
 
@@ -259,11 +271,51 @@ class MySQLEnumAdapter(SQLTypeAdapter):
                            representation (default, recommended).
         """
         self._use_int_storage = use_int_storage
+        # Per Enum class lookup of str(member.value) -> member, built on first use
+        self._value_tables: Dict[Type[Enum], Dict[str, Enum]] = {}
+        # Per Enum class members in definition order (MySQL ENUM index - 1)
+        self._member_sequences: Dict[Type[Enum], Tuple[Enum, ...]] = {}
 
     @property
     def supported_types(self) -> Dict[Type, List[Any]]:
         return {Enum: [str, int]}
 
+    def _members_by_value(self, enum_type: Type[Enum]) -> Dict[str, Enum]:
+        """
+        Return the string value lookup table for an Enum class.
+
+        The first member wins for duplicate string values, matching a
+        definition-order scan.
+
+        Args:
+            enum_type: Python Enum class
+
+        Returns:
+            Mapping of str(member.value) to member
+        """
+        table = self._value_tables.get(enum_type)
+        if table is None:
+            table = {}
+            for member in enum_type:
+                table.setdefault(str(member.value), member)
+            self._value_tables[enum_type] = table
+        return table
+
+    def _members_in_order(self, enum_type: Type[Enum]) -> Tuple[Enum, ...]:
+        """
+        Return the members of an Enum class in definition order.
+
+        Args:
+            enum_type: Python Enum class
+
+        Returns:
+            Tuple of members, where position + 1 is the MySQL ENUM index
+        """
+        members = self._member_sequences.get(enum_type)
+        if members is None:
+            members = self._member_sequences[enum_type] = tuple(enum_type)
+        return members
+
     def to_database(self, value: Enum, target_type: Type, options: Optional[Dict[str, Any]] = None) -> Any:
         """
         Convert Python Enum to database value.
@@ -292,6 +344,11 @@ class MySQLEnumAdapter(SQLTypeAdapter):
         if value is None:
             return None
 
+        # Common case: plain string storage with no per-call options, nothing to
+        # validate or resolve
+        if target_type is str and not options:
+            return str(value.value)
+
         # Validate against allowed values if provided
         enum_values = options.get('enum_values') if options else None
         if enum_values and value.value not in enum_values:
@@ -316,9 +373,8 @@ class MySQLEnumAdapter(SQLTypeAdapter):
         if target_type is int:
             if use_int:
                 # Use MySQL's internal integer index (1-based)
-                # Get the enum class members in definition order
-                enum_members = list(type(value))
-                return enum_members.index(value) + 1
+                # Position among the enum class members in definition order
+                return self._members_in_order(type(value)).index(value) + 1
             else:
                 # Use the enum's value if it's already an int
                 if isinstance(value.value, int):
@@ -357,9 +413,9 @@ class MySQLEnumAdapter(SQLTypeAdapter):
         if isinstance(value, str):
             # Lookup by value (for string enums)
             # First try to match the value directly
-            for member in target_type:
-                if str(member.value) == value:
-                    return member
+            member = self._members_by_value(target_type).get(value)
+            if member is not None:
+                return member
             # If not found, try name lookup as fallback
             try:
                 return target_type[value]
@@ -371,7 +427,7 @@ class MySQLEnumAdapter(SQLTypeAdapter):
 
         if isinstance(value, int):
             # Try to interpret as MySQL ENUM index (1-based)
-            enum_members = list(target_type)
+            enum_members = self._members_in_order(target_type)
             if 1 <= value <= len(enum_members):
                 return enum_members[value - 1]
 
@@ -546,6 +602,10 @@ class MySQLSetAdapter(SQLTypeAdapter):
         if value is None:
             return None
 
+        # Common case: the driver returns the comma-separated string
+        if type(value) is str:
+            return self._decode_set_from_string(value, target_type)
+
         # Handle integer storage (bit flags)
         if isinstance(value, int):
             allowed_values = self._allowed_values or (options.get('allowed_values') if options else None)
@@ -589,6 +649,13 @@ class MySQLVectorAdapter(SQLTypeAdapter):
                       If None, no dimension validation is performed.
         """
         self._dimension = dimension
+        # Decoder per driver value type, looked up by exact type in from_database;
+        # subclasses observed at runtime are added on first use
+        self._decoders = {
+            list: self._decode_vector_from_list,
+            bytes: self._decode_vector_from_bytes,
+            str: self._decode_vector_from_string,
+        }
 
     @property
     def supported_types(self) -> Dict[Type, List[Any]]:
@@ -641,13 +708,26 @@ class MySQLVectorAdapter(SQLTypeAdapter):
                 )
 
         # MySQL accepts string format '[1.0,2.0,3.0]' for VECTOR
-        # or use STRING_TO_VECTOR function
-        vector_str = '[' + ','.join(str(float(v)) for v in value) + ']'
+        # or use STRING_TO_VECTOR function. Elements are already validated, so
+        # format them with map() instead of a per-element generator frame.
+        vector_str = '[' + ','.join(map(str, map(float, value))) + ']'
 
         if target_type is bytes:
             return vector_str.encode('utf-8')
         return vector_str
 
+    def _decode_vector_from_list(self, value: list) -> List[float]:
+        """
+        Normalize an already parsed vector (some drivers return lists).
+
+        Args:
+            value: List of numeric values
+
+        Returns:
+            List of float values
+        """
+        return [float(v) for v in value]
+
     def _decode_vector_from_bytes(self, value: bytes) -> List[float]:
         """
         Decode MySQL VECTOR from binary format.
@@ -661,21 +741,27 @@ class MySQLVectorAdapter(SQLTypeAdapter):
         Raises:
             ValueError: If binary format is invalid
         """
-        # Try UTF-8 decode first (string format stored as bytes)
-        try:
-            return self._decode_vector_from_string(value.decode('utf-8'))
-        except UnicodeDecodeError:
-            pass
+        # VECTOR_TO_STRING output stored as bytes, bracketed or not, is ASCII
+        # text. Most packed floats are not, so they skip the text parse; an
+        # ASCII buffer that does not parse as numbers is still unpacked.
+        if value.isascii():
+            try:
+                return self._decode_vector_from_string(value.decode('ascii'))
+            except ValueError:
+                if len(value) % 4 != 0:
+                    raise
 
         # Binary format: packed IEEE 754 float32 values (little-endian)
-        import struct
-        float_count = len(value) // 4
         if len(value) % 4 != 0:
             raise ValueError(
                 f"Invalid VECTOR binary length: {len(value)} bytes "
                 f"(must be multiple of 4 for float32 values)"
-            ) from None
-        return list(struct.unpack(f'<{float_count}f', value))
+            )
+        # array decodes the whole buffer in C, which matters for wide vectors
+        floats = array('f', value)
+        if sys.byteorder == 'big':
+            floats.byteswap()
+        return floats.tolist()
 
     def _decode_vector_from_string(self, value: str) -> List[float]:
         """
@@ -698,9 +784,10 @@ class MySQLVectorAdapter(SQLTypeAdapter):
         if not value:
             return []
 
-        # Split by comma and convert to floats
+        # Split by comma and convert to floats; float() already ignores the
+        # whitespace around each element, so the whole pass stays in C
         try:
-            return [float(v.strip()) for v in value.split(',')]
+            return list(map(float, value.split(',')))
         except ValueError as e:
             raise ValueError(f"Cannot parse VECTOR value: {value}") from e
 
@@ -734,17 +821,19 @@ class MySQLVectorAdapter(SQLTypeAdapter):
                 f"got {target_type.__name__}"
             )
 
-        # Already a list (some drivers might parse it)
-        if isinstance(value, list):
-            return [float(v) for v in value]
-
-        # Binary format
-        if isinstance(value, bytes):
-            return self._decode_vector_from_bytes(value)
-
-        # String format
-        if isinstance(value, str):
-            return self._decode_vector_from_string(value)
+        # Driver types (list, bytes, str) and previously seen subclasses
+        # resolve with one dict lookup
+        value_type = type(value)
+        decoder = self._decoders.get(value_type)
+        if decoder is not None:
+            return decoder(value)
+
+        # Subclasses resolve through their MRO once, then hit the fast path
+        for base_type in value_type.__mro__[1:]:
+            decoder = self._decoders.get(base_type)
+            if decoder is not None:
+                self._decoders[value_type] = decoder
+                return decoder(value)
 
         raise TypeError(
             f"Cannot convert {type(value).__name__} to vector (list of floats)"
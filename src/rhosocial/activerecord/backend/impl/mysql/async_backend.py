@@ -9,6 +9,7 @@ the synchronous backend but uses async/await for I/O operations.
 """
 import datetime
 import logging
+import time
 from typing import List, Optional, Tuple
 
 import mysql.connector.aio as mysql_async
@@ -25,13 +26,20 @@ from rhosocial.activerecord.backend.errors import (
     IntegrityError,
     QueryError,
 )
+from rhosocial.activerecord.backend.options import ExecutionOptions, StatementType
 from rhosocial.activerecord.backend.result import QueryResult
 from rhosocial.activerecord.backend.introspection.backend_mixin import IntrospectorBackendMixin
 from rhosocial.activerecord.backend.explain import AsyncExplainBackendMixin
 from .config import MySQLConnectionConfig
 from .dialect import MySQLDialect
 from .async_transaction import AsyncMySQLTransactionManager
-from .mixins import MySQLBackendMixin, AsyncMySQLConcurrencyMixin
+from .mixins import (
+    MySQLBackendMixin, AsyncMySQLConcurrencyMixin,
+    _DML_KEYWORDS,
+    _DQL_KEYWORDS,
+    _LEADING_KEYWORD,
+    _MYSQL_CONFIG_PARAMS,
+)
 
 
 class AsyncMySQLBackend(AsyncExplainBackendMixin, IntrospectorBackendMixin, MySQLBackendMixin, AsyncMySQLConcurrencyMixin, AsyncStorageBackend):
@@ -54,22 +62,7 @@ class AsyncMySQLBackend(AsyncExplainBackendMixin, IntrospectorBackendMixin, MySQ
         if connection_config is None:
             # Extract MySQL-specific parameters from kwargs
             config_params = {}
-            mysql_specific_params = [
-                'host', 'port', 'database', 'username', 'password',
-                'charset', 'collation', 'timezone', 'version',
-                'pool_size', 'pool_timeout', 'pool_name', 'pool_reset_session', 'pool_pre_ping',
-                'ssl_ca', 'ssl_cert', 'ssl_key', 'ssl_verify_cert', 'ssl_verify_identity',
-                'log_queries', 'log_level',
-                'auth_plugin', 'autocommit', 'init_command', 'connect_timeout',
-                'read_timeout', 'write_timeout', 'use_pure', 'get_warnings',
-                'raise_on_warnings', 'buffered', 'raw', 'consume_results',
-                'force_ipv6', 'option_files', 'option_groups', 'use_unicode',
-                'sql_mode', 'time_zone', 'sql_log_off',
-                'compress', 'allow_local_infile', 'conn_attrs', 'client_flags',
-                'unix_socket', 'auth_plugin', 'allow_local_infile_in_path', 'dsn'
-            ]
-
-            for param in mysql_specific_params:
+            for param in _MYSQL_CONFIG_PARAMS:
                 if param in kwargs:
                     config_params[param] = kwargs[param]
 
@@ -480,15 +473,15 @@ class AsyncMySQLBackend(AsyncExplainBackendMixin, IntrospectorBackendMixin, MySQ
         Raises:
             DatabaseError: If execution fails after all retries
         """
-        from rhosocial.activerecord.backend.options import ExecutionOptions, StatementType
-
         # If no options provided, create default options from kwargs
         if options is None:
             # Determine statement type based on SQL
-            sql_upper = sql.strip().upper()
-            if sql_upper.startswith(('SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'PRAGMA', 'EXPLAIN')):
+            # Only the leading keyword matters; avoid upper-casing the whole statement
+            match = _LEADING_KEYWORD.match(sql)
+            keyword = match.group(1).upper() if match else ""
+            if keyword in _DQL_KEYWORDS:
                 stmt_type = StatementType.DQL
-            elif sql_upper.startswith(('INSERT', 'UPDATE', 'DELETE', 'REPLACE')):
+            elif keyword in _DML_KEYWORDS:
                 stmt_type = StatementType.DML
             else:
                 stmt_type = StatementType.DDL
@@ -554,8 +547,6 @@ class AsyncMySQLBackend(AsyncExplainBackendMixin, IntrospectorBackendMixin, MySQ
             sql_script: A string containing one or more SQL statements separated
                        by semicolons.
         """
-        import time
-
         self.log(logging.INFO, "Executing SQL script asynchronously.")
         start_time = time.perf_counter()
 
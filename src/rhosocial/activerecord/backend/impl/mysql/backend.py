@@ -8,6 +8,7 @@ specific behaviors and SQL dialect.
 """
 import datetime
 import logging
+import time
 from typing import List, Optional, Tuple
 
 import mysql.connector
@@ -24,13 +25,24 @@ from rhosocial.activerecord.backend.errors import (
     IntegrityError,
     QueryError,
 )
+from rhosocial.activerecord.backend.options import ExecutionOptions, StatementType
 from rhosocial.activerecord.backend.result import QueryResult
 from rhosocial.activerecord.backend.introspection.backend_mixin import IntrospectorBackendMixin
 from rhosocial.activerecord.backend.explain import SyncExplainBackendMixin
 from .config import MySQLConnectionConfig
 from .dialect import MySQLDialect
 from .transaction import MySQLTransactionManager
-from .mixins import MySQLBackendMixin, MySQLConcurrencyMixin
+from .mixins import (
+    MySQLBackendMixin, MySQLConcurrencyMixin,
+    _DML_KEYWORDS,
+    _DQL_KEYWORDS,
+    _LEADING_KEYWORD,
+    _MYSQL_CONFIG_PARAMS,
+)
+
+# mysql-connector-python 9.2.0 removed cursor.execute(..., multi=True); the
+# installed connector cannot change at runtime, so check its version once.
+_CONNECTOR_USES_NEXTSET = mysql.connector.version.VERSION >= (9, 2, 0)
 
 
 class MySQLBackend(SyncExplainBackendMixin, IntrospectorBackendMixin, MySQLBackendMixin, MySQLConcurrencyMixin, StorageBackend):
@@ -53,23 +65,7 @@ class MySQLBackend(SyncExplainBackendMixin, IntrospectorBackendMixin, MySQLBacke
         if connection_config is None:
             # Extract MySQL-specific parameters from kwargs
             config_params = {}
-            mysql_specific_params = [
-                'host', 'port', 'database', 'username', 'password',
-                'charset', 'collation', 'timezone', 'version',
-                'pool_size', 'pool_timeout', 'pool_name', 'pool_reset_session', 'pool_pre_ping',
-                'ssl_ca', 'ssl_cert', 'ssl_key', 'ssl_verify_cert', 'ssl_verify_identity',
-                'log_queries', 'log_level',
-                'auth_plugin', 'autocommit', 'init_command', 'connect_timeout',
-                'read_timeout', 'write_timeout', 'use_pure', 'get_warnings',
-                'raise_on_warnings', 'buffered', 'raw', 'consume_results',
-                'force_ipv6', 'option_files', 'option_groups', 'use_unicode',
-                'sql_mode', 'time_zone', 'sql_log_off',
-                'compress', 'allow_local_infile', 'conn_attrs',
-                'client_flags', 'unix_socket',
-                'allow_local_infile_in_path', 'dsn'
-            ]
-
-            for param in mysql_specific_params:
+            for param in _MYSQL_CONFIG_PARAMS:
                 if param in kwargs:
                     config_params[param] = kwargs[param]
 
@@ -468,15 +464,15 @@ class MySQLBackend(SyncExplainBackendMixin, IntrospectorBackendMixin, MySQLBacke
         Raises:
             DatabaseError: If execution fails after all retries
         """
-        from rhosocial.activerecord.backend.options import ExecutionOptions, StatementType
-
         # If no options provided, create default options from kwargs
         if options is None:
             # Determine statement type based on SQL
-            sql_upper = sql.strip().upper()
-            if sql_upper.startswith(('SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'PRAGMA', 'EXPLAIN')):
+            # Only the leading keyword matters; avoid upper-casing the whole statement
+            match = _LEADING_KEYWORD.match(sql)
+            keyword = match.group(1).upper() if match else ""
+            if keyword in _DQL_KEYWORDS:
                 stmt_type = StatementType.DQL
-            elif sql_upper.startswith(('INSERT', 'UPDATE', 'DELETE', 'REPLACE')):
+            elif keyword in _DML_KEYWORDS:
                 stmt_type = StatementType.DML
             else:
                 stmt_type = StatementType.DDL
@@ -543,9 +539,6 @@ class MySQLBackend(SyncExplainBackendMixin, IntrospectorBackendMixin, MySQLBacke
             sql_script: A string containing one or more SQL statements separated
                        by semicolons.
         """
-        import time
-        import mysql.connector
-
         self.log(logging.INFO, "Executing SQL script.")
         start_time = time.perf_counter()
 
@@ -556,12 +549,7 @@ class MySQLBackend(SyncExplainBackendMixin, IntrospectorBackendMixin, MySQLBacke
         try:
             cursor = self._connection.cursor()
 
-            # Check mysql-connector-python version for API compatibility
-            # Version 9.2.0+ removed the 'multi' parameter
-            version = mysql.connector.version.VERSION
-            use_new_api = version >= (9, 2, 0)
-
-            if use_new_api:
+            if _CONNECTOR_USES_NEXTSET:
                 # 9.2.0+: Execute directly, use nextset() for multiple result sets
                 cursor.execute(sql_script)
                 # Consume all result sets
@@ -5,7 +5,8 @@ MySQL backend SQL dialect implementation.
 This dialect implements protocols for features that MySQL actually supports,
 based on the MySQL version provided at initialization.
 """
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
 
 from rhosocial.activerecord.backend.dialect.base import SQLDialectBase
 from rhosocial.activerecord.backend.dialect.protocols import (
@@ -63,6 +64,15 @@ from rhosocial.activerecord.backend.dialect.mixins import (
     IntrospectionMixin,
 )
 from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
+from rhosocial.activerecord.backend.expression.bases import BaseExpression
+from rhosocial.activerecord.backend.expression.statements import (
+    ColumnConstraintType,
+    DefaultValuesSource,
+    ExplainType,
+    SelectSource,
+    ValuesSource,
+)
+from rhosocial.activerecord.backend.transaction import IsolationLevel, TransactionMode
 from .protocols import (
     MySQLTriggerSupport,
     MySQLTableSupport,
@@ -88,6 +98,22 @@ from .mixins import (
     MySQLIntrospectionMixin,
     MySQLLockingMixin,
     MySQLModifyColumnMixin,
+    _MYSQL_ISOLATION_LEVELS,
+    _MYSQL_5_1_0,
+    _MYSQL_5_6_0,
+    _MYSQL_5_6_5,
+    _MYSQL_5_7_0,
+    _MYSQL_5_7_8,
+    _MYSQL_5_7_9,
+    _MYSQL_8_0_0,
+    _MYSQL_8_0_4,
+    _MYSQL_8_0_14,
+    _MYSQL_8_0_16,
+    _MYSQL_8_0_18,
+    _MYSQL_8_0_31,
+    _MYSQL_9_0_0,
+    _escape_load_data_string,
+    _pack_version,
 )
 from .show.dialect import MySQLShowDialectMixin
 
@@ -103,6 +129,85 @@ if TYPE_CHECKING:
     )
 
 
+class _ExplainCaps(NamedTuple):
+    """EXPLAIN capabilities of one server version, resolved at dialect init."""
+
+    analyze: bool  # EXPLAIN ANALYZE, since 8.0.18
+    force_traditional: bool  # 9.0+ defaults to TREE; request TRADITIONAL explicitly
+    formats: FrozenSet[str]  # Accepted FORMAT= names
+
+
+@lru_cache(maxsize=None)
+def _explain_caps_for(version_int: int) -> _ExplainCaps:
+    """Resolve EXPLAIN capabilities for a packed server version.
+
+    Dialects for the same server version share one immutable result, so
+    creating a dialect per connection does not rebuild the format set.
+    """
+    formats = {"TEXT"}
+    if version_int >= _MYSQL_5_6_5:
+        formats.add("JSON")  # JSON format since 5.6.5
+    if version_int >= _MYSQL_8_0_16:
+        formats.add("TREE")  # TREE format since 8.0.16
+    return _ExplainCaps(
+        analyze=version_int >= _MYSQL_8_0_18,
+        force_traditional=version_int >= _MYSQL_9_0_0,
+        formats=frozenset(formats),
+    )
+
+
+@lru_cache(maxsize=None)
+def _function_bounds_for(dialect_cls: type) -> Dict[str, Tuple[int, Optional[int]]]:
+    """Pack a dialect class's function version table into integer bounds.
+
+    Resolved per class, so subclasses that override ``_MYSQL_FUNCTION_VERSIONS``
+    get their own table. Functions available on every version are omitted.
+    """
+    return {
+        name: (
+            _pack_version(min_version) if min_version is not None else 0,
+            _pack_version(max_version) if max_version is not None else None,
+        )
+        for name, (min_version, max_version) in dialect_cls._MYSQL_FUNCTION_VERSIONS.items()
+        if min_version is not None or max_version is not None
+    }
+
+
+@lru_cache(maxsize=None)
+def _function_names() -> Tuple[str, ...]:
+    """Return core function names followed by MySQL-only function names.
+
+    The function modules are imported lazily on first use and the combined
+    name list is resolved once per process.
+    """
+    from rhosocial.activerecord.backend.expression.functions import (
+        __all__ as core_functions,
+    )
+    from rhosocial.activerecord.backend.impl.mysql import functions as mysql_functions
+
+    names = dict.fromkeys(core_functions)
+    names.update(dict.fromkeys(getattr(mysql_functions, "__all__", [])))
+    return tuple(names)
+
+
+# MySQL maximum value for BIGINT UNSIGNED, used as LIMIT when only OFFSET is given
+_MYSQL_MAX_ROW_COUNT = 18446744073709551615
+
+
+# Translation table for single-pass escaping of quoted identifiers.
+_IDENTIFIER_ESCAPES = str.maketrans({"`": "``"})
+
+
+@lru_cache(maxsize=4096)
+def _quote_identifier(identifier: str) -> str:
+    """Backtick-quote an identifier, doubling embedded backticks.
+
+    Table and column names recur on nearly every statement, so the quoted
+    form is memoized. Only identifiers are cached; literals are not.
+    """
+    return f"`{identifier.translate(_IDENTIFIER_ESCAPES)}`"
+
+
 class MySQLDialect(
     SQLDialectBase,
     # Include mixins for features that MySQL supports (with version-dependent implementations)
@@ -200,6 +305,25 @@ class MySQLDialect(
     - MERGE statement (not supported, use ON DUPLICATE KEY UPDATE or REPLACE)
     """
 
+    # SET TRANSACTION isolation level keywords
+    _ISOLATION_LEVEL_NAMES: Dict[IsolationLevel, str] = _MYSQL_ISOLATION_LEVELS
+    # SET TRANSACTION access mode keywords
+    _TRANSACTION_MODE_NAMES: Dict[TransactionMode, str] = {
+        TransactionMode.READ_ONLY: "READ ONLY",
+        TransactionMode.READ_WRITE: "READ WRITE",
+    }
+
+    # Column constraints that render as a fixed keyword
+    _COLUMN_CONSTRAINT_KEYWORDS: Dict[ColumnConstraintType, str] = {
+        ColumnConstraintType.PRIMARY_KEY: "PRIMARY KEY",
+        ColumnConstraintType.NOT_NULL: "NOT NULL",
+        ColumnConstraintType.UNIQUE: "UNIQUE",
+        ColumnConstraintType.NULL: "NULL",
+    }
+
+    # Upper bound on memoized JSON path literals per dialect
+    _JSON_PATH_CACHE_LIMIT = 1024
+
     def __init__(self, version: Tuple[int, int, int] = (8, 0, 0)):
         """
         Initialize MySQL dialect with specific version.
@@ -208,7 +332,19 @@ class MySQLDialect(
             version: MySQL version tuple (major, minor, patch)
         """
         self.version = version
+        self._version_int = _pack_version(version)
         super().__init__()
+        # EXPLAIN capabilities only depend on the server version, so resolve
+        # them once here instead of re-evaluating version gates on every call.
+        self._explain_caps = _explain_caps_for(self._version_int)
+        # Feature gates consulted on every CTE/window/JSON expression build
+        self._is_mysql8 = self._version_int >= _MYSQL_8_0_0
+        self._supports_json = self._version_int >= _MYSQL_5_7_8
+        self._supports_json_arrows = self._version_int >= _MYSQL_5_7_9
+        # Packed bounds of this class's _MYSQL_FUNCTION_VERSIONS table
+        self._function_bounds = _function_bounds_for(type(self))
+        # Quoted JSON path literals, see _json_path_literal()
+        self._json_path_literals: Dict[str, str] = {}
 
     def get_parameter_placeholder(self, position: int = 0) -> str:
         """MySQL uses '%s' for placeholders."""
@@ -221,11 +357,11 @@ class MySQLDialect(
     # region Protocol Support Checks based on version
     def supports_basic_cte(self) -> bool:
         """Basic CTEs are supported since MySQL 8.0.0."""
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_recursive_cte(self) -> bool:
         """Recursive CTEs are supported since MySQL 8.0.0."""
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_materialized_cte(self) -> bool:
         """MySQL does not support MATERIALIZED hint for CTEs."""
@@ -237,11 +373,11 @@ class MySQLDialect(
 
     def supports_window_functions(self) -> bool:
         """Window functions are supported since MySQL 8.0.0."""
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_window_frame_clause(self) -> bool:
         """Whether window frame clauses (ROWS/RANGE) are supported, since MySQL 8.0.0."""
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_filter_clause(self) -> bool:
         """FILTER clause for aggregate functions is not supported in MySQL."""
@@ -249,7 +385,7 @@ class MySQLDialect(
 
     def supports_json_type(self) -> bool:
         """JSON is supported since MySQL 5.7.8."""
-        return self.version >= (5, 7, 8)
+        return self._supports_json
 
     def get_json_access_operator(self) -> str:
         """MySQL uses '->' for JSON access (shorthand for JSON_EXTRACT)."""
@@ -282,20 +418,11 @@ class MySQLDialect(
     def supports_explain_analyze(self) -> bool:
         """Whether EXPLAIN ANALYZE is supported."""
         # MySQL 8.0.18+ supports ANALYZE
-        return self.version >= (8, 0, 18)
+        return self._explain_caps.analyze
 
     def supports_explain_format(self, format_type: str) -> bool:
         """Check if specific EXPLAIN format is supported."""
-        format_type_upper = format_type.upper()
-        # MySQL supports TEXT, JSON formats; TREE format added in 8.0.16
-        if format_type_upper == "TEXT":
-            return True
-        elif format_type_upper == "JSON":
-            return self.version >= (5, 6, 5)  # JSON format since 5.6.5
-        elif format_type_upper == "TREE":
-            return self.version >= (8, 0, 16)  # TREE format since 8.0.16
-        else:
-            return False
+        return format_type.upper() in self._explain_caps.formats
 
     def format_explain_statement(self, explain_expr: "ExplainExpression") -> tuple:
         """Build the MySQL EXPLAIN SQL string and return (sql, params).
@@ -310,37 +437,33 @@ class MySQLDialect(
         with text output. For consistent parsing, we force TRADITIONAL format for
         MySQL 9.0+ when no explicit format is specified.
         """
-        from rhosocial.activerecord.backend.expression.statements import ExplainType
-
         statement_sql, statement_params = explain_expr.statement.to_sql()
         options = explain_expr.options
-        parts = ["EXPLAIN"]
+        force_traditional = self._explain_caps.force_traditional
 
-        # Determine if we need to add FORMAT=TRADITIONAL
-        needs_traditional_format = False
         if options is None:
-            # No options specified - check if MySQL 9.0+ needs TRADITIONAL format
-            needs_traditional_format = self.version >= (9, 0, 0)
-        else:
-            # ANALYZE goes before FORMAT (MySQL ordering)
-            if options.analyze:
-                parts.append("ANALYZE")
-
-            if options.format is not None:
-                fmt_name = options.format.name if hasattr(options.format, "name") else str(options.format)
-                parts.append(f"FORMAT={fmt_name.upper()}")
-            elif options.type is not None and options.type == ExplainType.QUERY_PLAN:
-                # MySQL has no QUERY PLAN keyword; fall through to plain EXPLAIN
-                pass
-            else:
-                # No format specified - check if MySQL 9.0+ needs TRADITIONAL format
-                needs_traditional_format = self.version >= (9, 0, 0)
+            # No options specified - MySQL 9.0+ defaults to TREE format, so force
+            # TRADITIONAL for consistent parsing
+            if force_traditional:
+                return f"EXPLAIN FORMAT=TRADITIONAL {statement_sql}", statement_params
+            return f"EXPLAIN {statement_sql}", statement_params
+
+        # ANALYZE goes before FORMAT (MySQL ordering)
+        prefix = "EXPLAIN ANALYZE" if options.analyze else "EXPLAIN"
 
-        # MySQL 9.0+ defaults to TREE format; force TRADITIONAL for consistent parsing
-        if needs_traditional_format:
-            parts.append("FORMAT=TRADITIONAL")
+        # Read the format once; options are never modified here, so callers
+        # may share one ExplainOptions instance across queries.
+        fmt = options.format
+        if fmt is not None:
+            fmt_name = getattr(fmt, "name", None) or str(fmt)
+            return f"{prefix} FORMAT={fmt_name.upper()} {statement_sql}", statement_params
 
-        return f"{' '.join(parts)} {statement_sql}", statement_params
+        # MySQL has no QUERY PLAN keyword; it falls through to plain EXPLAIN
+        if options.type == ExplainType.QUERY_PLAN or not force_traditional:
+            return f"{prefix} {statement_sql}", statement_params
+
+        # No format specified on MySQL 9.0+ - force TRADITIONAL for consistent parsing
+        return f"{prefix} FORMAT=TRADITIONAL {statement_sql}", statement_params
 
     def supports_graph_match(self) -> bool:
         """Whether graph query MATCH clause is supported."""
@@ -384,7 +507,7 @@ class MySQLDialect(
 
     def supports_lateral_join(self) -> bool:
         """Whether LATERAL joins are supported."""
-        return self.version >= (8, 0, 14)  # LATERAL joins added in 8.0.14
+        return self._version_int >= _MYSQL_8_0_14  # LATERAL joins added in 8.0.14
 
     def supports_ordered_set_aggregation(self) -> bool:
         """Whether ordered-set aggregate functions are supported."""
@@ -430,11 +553,11 @@ class MySQLDialect(
 
     def supports_intersect(self) -> bool:
         """INTERSECT is supported since MySQL 8.0.31."""
-        return self.version >= (8, 0, 31)
+        return self._version_int >= _MYSQL_8_0_31
 
     def supports_except(self) -> bool:
         """EXCEPT is supported since MySQL 8.0.31."""
-        return self.version >= (8, 0, 31)
+        return self._version_int >= _MYSQL_8_0_31
 
     def supports_set_operation_order_by(self) -> bool:
         """Set operations support ORDER BY."""
@@ -459,9 +582,8 @@ class MySQLDialect(
         Returns:
             Quoted identifier with escaped internal backticks
         """
-        # Escape any internal backticks by doubling them
-        escaped = identifier.replace('`', '``')
-        return f"`{escaped}`"
+        # Internal backticks are doubled; results are memoized per identifier
+        return _quote_identifier(identifier)
 
     def format_column(self, name: str, table: Optional[str] = None,
                       alias: Optional[str] = None,
@@ -490,30 +612,20 @@ class MySQLDialect(
         
         MySQL requires LIMIT when using OFFSET.
         """
-        params = []
-        sql_parts = []
-
-        if limit is not None:
-            sql_parts.append("LIMIT %s")
-            params.append(limit)
-        
-        if offset is not None:
+        # Values are always bound, so the clause is one of three fixed strings
+        if offset is None:
             if limit is None:
-                # MySQL requires LIMIT when using OFFSET, use a very large number
-                sql_parts.append("LIMIT %s")
-                params.append(18446744073709551615)  # MySQL maximum value for BIGINT UNSIGNED
-            sql_parts.append("OFFSET %s")
-            params.append(offset)
-
-        if not sql_parts:
-            return None, []
-
-        return " ".join(sql_parts), params
+                return None, []
+            return "LIMIT %s", [limit]
+        if limit is None:
+            # MySQL requires LIMIT when using OFFSET, use a very large number
+            return "LIMIT %s OFFSET %s", [_MYSQL_MAX_ROW_COUNT, offset]
+        return "LIMIT %s OFFSET %s", [limit, offset]
 
     def supports_json_arrow_operators(self) -> bool:
         """Check if MySQL version supports -> and ->> operators."""
         # -> and ->> operators were added in MySQL 5.7.9
-        return self.version >= (5, 7, 9)
+        return self._supports_json_arrows
 
     # region View Support
     def supports_or_replace_view(self) -> bool:
@@ -572,11 +684,10 @@ class MySQLDialect(
         self, expr: "DropViewExpression"
     ) -> Tuple[str, tuple]:
         """Format DROP VIEW statement for MySQL."""
-        parts = ["DROP VIEW"]
+        view_name = self.format_identifier(expr.view_name)
         if expr.if_exists:
-            parts.append("IF EXISTS")
-        parts.append(self.format_identifier(expr.view_name))
-        return ' '.join(parts), ()
+            return f"DROP VIEW IF EXISTS {view_name}", ()
+        return f"DROP VIEW {view_name}", ()
     # endregion
 
     # region Schema Support
@@ -670,9 +781,7 @@ class MySQLDialect(
             return self._format_create_table_like(expr)
 
         # Build standard CREATE TABLE statement
-        from rhosocial.activerecord.backend.expression.statements import (
-            ColumnConstraintType, TableConstraintType
-        )
+        from rhosocial.activerecord.backend.expression.statements import TableConstraintType
 
         all_params: List[Any] = []
 
@@ -744,39 +853,36 @@ class MySQLDialect(
         ColumnConstraintType
     ) -> Tuple[str, List[Any]]:
         """Format a single column definition with MySQL-specific syntax."""
-        parts = [self.format_identifier(col_def.name), col_def.data_type]
+        name_sql = self.format_identifier(col_def.name)
+        # Bare columns (no constraints, no comment) skip the parts list entirely
+        if not col_def.constraints and not col_def.comment:
+            return f"{name_sql} {col_def.data_type}", []
+
+        parts = [name_sql, col_def.data_type]
         params: List[Any] = []
 
-        # Build constraint parts
-        constraint_parts = []
+        # Constraint keywords go straight into parts; one join builds the definition
+        add_part = parts.append
+        keywords = self._COLUMN_CONSTRAINT_KEYWORDS
         for constraint in col_def.constraints:
-            if constraint.constraint_type == ColumnConstraintType.PRIMARY_KEY:
-                constraint_parts.append("PRIMARY KEY")
-            elif constraint.constraint_type == ColumnConstraintType.NOT_NULL:
-                constraint_parts.append("NOT NULL")
-            elif constraint.constraint_type == ColumnConstraintType.UNIQUE:
-                constraint_parts.append("UNIQUE")
+            keyword = keywords.get(constraint.constraint_type)
+            if keyword is not None:
+                add_part(keyword)
             elif constraint.constraint_type == ColumnConstraintType.DEFAULT:
                 if constraint.default_value is not None:
-                    from rhosocial.activerecord.backend.expression import bases
-                    if isinstance(constraint.default_value, bases.BaseExpression):
+                    if isinstance(constraint.default_value, BaseExpression):
                         default_sql, default_params = constraint.default_value.to_sql()
-                        constraint_parts.append(f"DEFAULT {default_sql}")
+                        add_part(f"DEFAULT {default_sql}")
                         params.extend(default_params)
                     elif isinstance(constraint.default_value, str):
                         escaped = self._escape_sql_string(constraint.default_value)
-                        constraint_parts.append(f"DEFAULT '{escaped}'")
+                        add_part(f"DEFAULT '{escaped}'")
                     else:
-                        constraint_parts.append(f"DEFAULT {constraint.default_value}")
-            elif constraint.constraint_type == ColumnConstraintType.NULL:
-                constraint_parts.append("NULL")
+                        add_part(f"DEFAULT {constraint.default_value}")
 
             # Handle AUTO_INCREMENT (MySQL-specific)
             if constraint.is_auto_increment:
-                constraint_parts.append("AUTO_INCREMENT")
-
-        if constraint_parts:
-            parts.append(' '.join(constraint_parts))
+                add_part("AUTO_INCREMENT")
 
         # Add column comment (MySQL-specific)
         if col_def.comment:
@@ -840,22 +946,14 @@ class MySQLDialect(
 
     def _format_inline_index_mysql(self, idx_def: "IndexDefinition") -> str:
         """Format an inline index definition (MySQL-specific)."""
-        parts = []
-
-        if idx_def.unique:
-            parts.append("UNIQUE")
-
-        parts.append("INDEX")
-        parts.append(self.format_identifier(idx_def.name))
-
+        keyword = "UNIQUE INDEX" if idx_def.unique else "INDEX"
         cols_str = ', '.join(self.format_identifier(c) for c in idx_def.columns)
-        parts.append(f"({cols_str})")
+        sql = f"{keyword} {self.format_identifier(idx_def.name)} ({cols_str})"
 
         # MySQL USING syntax for index type
         if idx_def.type:
-            parts.append(f"USING {idx_def.type}")
-
-        return ' '.join(parts)
+            return f"{sql} USING {idx_def.type}"
+        return sql
 
     def _format_storage_options_mysql(self, storage_options: Dict[str, Any]) -> str:
         """
@@ -867,13 +965,7 @@ class MySQLDialect(
         Returns:
             Formatted storage options string (e.g., "ENGINE=InnoDB DEFAULT CHARSET=utf8mb4")
         """
-        parts = []
-        for key, value in storage_options.items():
-            if isinstance(value, str):
-                parts.append(f"{key}={value}")
-            else:
-                parts.append(f"{key}={value}")
-        return ' '.join(parts)
+        return ' '.join(f"{key}={value}" for key, value in storage_options.items())
     # endregion
 
     # region Trigger Support (MySQL-specific)
@@ -984,24 +1076,20 @@ class MySQLDialect(
         if not self.supports_trigger():
             raise UnsupportedFeatureError(self.name, "triggers")
 
-        parts = ["DROP TRIGGER"]
-
+        trigger_name = self.format_identifier(expr.trigger_name)
         if expr.if_exists:
-            parts.append("IF EXISTS")
-
-        parts.append(self.format_identifier(expr.trigger_name))
-
-        return " ".join(parts), ()
+            return f"DROP TRIGGER IF EXISTS {trigger_name}", ()
+        return f"DROP TRIGGER {trigger_name}", ()
     # endregion
     
     # region FULLTEXT Index Support
     def supports_fulltext_index(self) -> bool:
         """MySQL 5.6+ supports FULLTEXT for InnoDB."""
-        return self.version >= (5, 6, 0)
+        return self._version_int >= _MYSQL_5_6_0
     
     def supports_fulltext_parser(self) -> bool:
         """MySQL supports FULLTEXT parser plugins."""
-        return self.version >= (5, 1, 0)
+        return self._version_int >= _MYSQL_5_1_0
     
     def supports_fulltext_query_expansion(self) -> bool:
         """MySQL supports QUERY EXPANSION."""
@@ -1030,15 +1118,8 @@ class MySQLDialect(
         search_params = (search_string,)
 
         if mode:
-            mode_upper = mode.upper()
-            if mode_upper == "NATURAL_LANGUAGE":
-                mode_str = "IN NATURAL LANGUAGE MODE"
-            elif mode_upper == "BOOLEAN":
-                mode_str = "IN BOOLEAN MODE"
-            elif mode_upper == "QUERY_EXPANSION":
-                mode_str = "IN NATURAL LANGUAGE MODE WITH QUERY EXPANSION"
-            else:
-                mode_str = ""
+            # Unknown modes add no modifier
+            mode_str = self._MATCH_MODE_CLAUSES.get(mode.upper(), "")
         else:
             mode_str = "IN NATURAL LANGUAGE MODE"
 
@@ -1053,28 +1134,28 @@ class MySQLDialect(
 
         MySQL 8.0+ supports invisible indexes that are not used by the optimizer.
         """
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_descending_index(self) -> bool:
         """Whether descending indexes are supported.
 
         MySQL 8.0+ supports true descending indexes (not just reverse scans).
         """
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_functional_index(self) -> bool:
         """Whether functional (expression) indexes are supported.
 
         MySQL 8.0+ supports indexes on expressions (functional indexes).
         """
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_check_constraint(self) -> bool:
         """Whether CHECK constraints are enforced.
 
         MySQL 8.0.16+ enforces CHECK constraints (before that, they were parsed but ignored).
         """
-        return self.version >= (8, 0, 16)
+        return self._version_int >= _MYSQL_8_0_16
 
     # ConstraintSupport protocol implementation
     def supports_constraint_enforced(self) -> bool:
@@ -1082,7 +1163,7 @@ class MySQLDialect(
 
         MySQL 8.0.16+ supports ENFORCED/NOT ENFORCED (SQL:2016).
         """
-        return self.version >= (8, 0, 16)
+        return self._version_int >= _MYSQL_8_0_16
 
     def supports_fk_match(self) -> bool:
         """Whether MATCH {SIMPLE|PARTIAL|FULL} is supported.
@@ -1103,14 +1184,14 @@ class MySQLDialect(
 
         MySQL 5.7+ supports generated columns (STORED and VIRTUAL).
         """
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def supports_default_column_value_expression(self) -> bool:
         """Whether DEFAULT column values can use expressions.
 
         MySQL 8.0+ supports expressions in DEFAULT column values.
         """
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
     # endregion
 
     # region Transaction Control
@@ -1169,6 +1250,10 @@ class MySQLDialect(
         "bit_shift_right": ((8, 0, 0), None),  # Added in 8.0
     }
 
+    # Resolved supports_functions() maps shared by dialects of the same class
+    # and server version; callers receive a copy.
+    _function_support_cache: Dict[Tuple[type, int], Dict[str, bool]] = {}
+
     def supports_functions(self) -> Dict[str, bool]:
         """Return supported SQL functions as function_name -> bool mapping.
 
@@ -1184,21 +1269,15 @@ class MySQLDialect(
         Returns:
             Dict mapping function names to True (supported) or False.
         """
-        from rhosocial.activerecord.backend.expression.functions import (
-            __all__ as core_functions,
-        )
-        from rhosocial.activerecord.backend.impl.mysql import functions as mysql_functions
-
-        result = {}
-        for func_name in core_functions:
-            result[func_name] = self._is_mysql_function_supported(func_name)
-
-        mysql_funcs = getattr(mysql_functions, "__all__", [])
-        for func_name in mysql_funcs:
-            if func_name not in result:
-                result[func_name] = self._is_mysql_function_supported(func_name)
-
-        return result
+        key = (type(self), self._version_int)
+        support = self._function_support_cache.get(key)
+        if support is None:
+            support = {
+                func_name: self._is_mysql_function_supported(func_name)
+                for func_name in _function_names()
+            }
+            self._function_support_cache[key] = support
+        return dict(support)
 
     def _is_mysql_function_supported(self, func_name: str) -> bool:
         """Check if a MySQL-specific function is supported based on version.
@@ -1209,23 +1288,18 @@ class MySQLDialect(
         Returns:
             True if supported, False otherwise
         """
-        version_range = self._MYSQL_FUNCTION_VERSIONS.get(func_name)
-        if version_range is None:
+        bounds = self._function_bounds.get(func_name)
+        if bounds is None:
             return True
 
-        min_version, max_version = version_range
-
-        if min_version is not None and self.version < min_version:
+        min_version, max_version = bounds
+        if self._version_int < min_version:
             return False
-
-        if max_version is not None and self.version > max_version:
-            return False
-
-        return True
+        return max_version is None or self._version_int <= max_version
 
     def supports_transaction_mode(self) -> bool:
         """MySQL supports READ ONLY transactions (5.6.5+)."""
-        return self.version >= (5, 6, 5)
+        return self._version_int >= _MYSQL_5_6_5
 
     def supports_isolation_level_in_begin(self) -> bool:
         """MySQL does not support isolation level in START TRANSACTION.
@@ -1236,7 +1310,7 @@ class MySQLDialect(
 
     def supports_read_only_transaction(self) -> bool:
         """MySQL supports READ ONLY transactions (5.6.5+)."""
-        return self.version >= (5, 6, 5)
+        return self._version_int >= _MYSQL_5_6_5
 
     def supports_deferrable_transaction(self) -> bool:
         """MySQL does not support DEFERRABLE mode."""
@@ -1265,31 +1339,22 @@ class MySQLDialect(
             This statement must be executed before START TRANSACTION.
             The MySQLTransactionManager._do_begin() handles this sequencing.
         """
-        from rhosocial.activerecord.backend.transaction import IsolationLevel, TransactionMode
-
         params = expr.get_params()
         parts = []
 
         # Handle isolation level
         isolation_level = params.get("isolation_level")
         if isolation_level is not None:
-            level_names = {
-                IsolationLevel.READ_UNCOMMITTED: "READ UNCOMMITTED",
-                IsolationLevel.READ_COMMITTED: "READ COMMITTED",
-                IsolationLevel.REPEATABLE_READ: "REPEATABLE READ",
-                IsolationLevel.SERIALIZABLE: "SERIALIZABLE",
-            }
-            level_name = level_names.get(isolation_level)
+            level_name = self._ISOLATION_LEVEL_NAMES.get(isolation_level)
             if level_name:
                 parts.append(f"ISOLATION LEVEL {level_name}")
 
         # Handle transaction mode (READ ONLY/READ WRITE)
         mode = params.get("mode")
         if mode is not None:
-            if mode == TransactionMode.READ_ONLY:
-                parts.append("READ ONLY")
-            elif mode == TransactionMode.READ_WRITE:
-                parts.append("READ WRITE")
+            mode_name = self._TRANSACTION_MODE_NAMES.get(mode)
+            if mode_name:
+                parts.append(mode_name)
 
         if not parts:
             return "SET TRANSACTION", ()
@@ -1316,8 +1381,6 @@ class MySQLDialect(
             format_set_transaction() for that purpose, which should be called
             before this method by MySQLTransactionManager._do_begin().
         """
-        from rhosocial.activerecord.backend.transaction import TransactionMode
-
         params = expr.get_params()
 
         # Build START TRANSACTION (without isolation level)
@@ -1404,22 +1467,22 @@ class MySQLDialect(
             parts.append(columns_sql)
 
         # Format source (VALUES, SELECT, or DEFAULT VALUES)
-        from rhosocial.activerecord.backend.expression.statements import (
-            DefaultValuesSource, ValuesSource, SelectSource
-        )
-
         if isinstance(expr.source, DefaultValuesSource):
             parts.append("DEFAULT VALUES")
         elif isinstance(expr.source, ValuesSource):
+            # Bulk inserts can render thousands of values; bind the list
+            # methods once instead of resolving them per value.
             all_rows_sql = []
+            add_row = all_rows_sql.append
+            add_params = all_params.extend
             for row in expr.source.values_list:
-                row_sql, row_params = [], []
+                row_sql = []
+                add_value = row_sql.append
                 for val in row:
                     s, p = val.to_sql()
-                    row_sql.append(s)
-                    row_params.extend(p)
-                all_rows_sql.append(f"({', '.join(row_sql)})")
-                all_params.extend(row_params)
+                    add_value(s)
+                    add_params(p)
+                add_row(f"({', '.join(row_sql)})")
             parts.append("VALUES " + ", ".join(all_rows_sql))
         elif isinstance(expr.source, SelectSource):
             s_sql, s_params = expr.source.select_query.to_sql()
@@ -1436,7 +1499,6 @@ class MySQLDialect(
 
         # Note: MySQL does not support RETURNING clause
         if expr.returning:
-            from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
             raise UnsupportedFeatureError(
                 self.name,
                 "RETURNING clause (MySQL does not support RETURNING)"
@@ -1473,7 +1535,7 @@ class MySQLDialect(
         parts.append("INFILE")
 
         # File path needs to be quoted as string literal
-        file_path_escaped = expr.file_path.replace("", "").replace("'", "\'")
+        file_path_escaped = _escape_load_data_string(expr.file_path)
         parts.append(f"'{file_path_escaped}'")
 
         if expr.options.replace:
@@ -1491,13 +1553,13 @@ class MySQLDialect(
         # Fields options
         field_parts = []
         if expr.options.fields_terminated_by is not None:
-            term = expr.options.fields_terminated_by.replace("", "").replace("'", "\'")
+            term = _escape_load_data_string(expr.options.fields_terminated_by)
             field_parts.append(f"TERMINATED BY '{term}'")
         if expr.options.fields_enclosed_by is not None:
-            enc = expr.options.fields_enclosed_by.replace("", "").replace("'", "\'")
+            enc = _escape_load_data_string(expr.options.fields_enclosed_by)
             field_parts.append(f"ENCLOSED BY '{enc}'")
         if expr.options.fields_escaped_by is not None:
-            esc = expr.options.fields_escaped_by.replace("", "").replace("'", "\'")
+            esc = _escape_load_data_string(expr.options.fields_escaped_by)
             field_parts.append(f"ESCAPED BY '{esc}'")
 
         if field_parts:
@@ -1507,10 +1569,10 @@ class MySQLDialect(
         # Lines options
         line_parts = []
         if expr.options.lines_starting_by is not None:
-            start = expr.options.lines_starting_by.replace("", "").replace("'", "\'")
+            start = _escape_load_data_string(expr.options.lines_starting_by)
             line_parts.append(f"STARTING BY '{start}'")
         if expr.options.lines_terminated_by is not None:
-            term = expr.options.lines_terminated_by.replace("", "").replace("'", "\'")
+            term = _escape_load_data_string(expr.options.lines_terminated_by)
             line_parts.append(f"TERMINATED BY '{term}'")
 
         if line_parts:
@@ -1542,7 +1604,7 @@ class MySQLDialect(
 
         JSON_TABLE is supported in MySQL 8.0.4+.
         """
-        return self.version >= (8, 0, 4)
+        return self._version_int >= _MYSQL_8_0_4
 
     def format_on_conflict_clause(self, expr) -> Tuple[str, tuple]:
         """Format ON DUPLICATE KEY UPDATE for MySQL.
@@ -1573,6 +1635,19 @@ class MySQLDialect(
 
         return " ".join(parts), tuple(all_params)
 
+    def _json_path_literal(self, path: str) -> str:
+        """Return a JSON path as an escaped, single-quoted SQL literal.
+
+        Applications reuse a small set of paths, so the quoted form is
+        memoized per dialect up to ``_JSON_PATH_CACHE_LIMIT`` entries.
+        """
+        literal = self._json_path_literals.get(path)
+        if literal is None:
+            literal = f"'{self._escape_sql_string(path)}'"
+            if len(self._json_path_literals) < self._JSON_PATH_CACHE_LIMIT:
+                self._json_path_literals[path] = literal
+        return literal
+
     def format_json_table_expression(self, expr) -> Tuple[str, tuple]:
         """Format JSON_TABLE expression.
 
@@ -1594,8 +1669,8 @@ class MySQLDialect(
             parts.append(str(expr.json_doc))
 
         parts.append(",")
-        escaped_path = self._escape_sql_string(expr.path)
-        parts.append(f"'{escaped_path}'")
+        json_path = self._json_path_literal
+        parts.append(json_path(expr.path))
         parts.append(" COLUMNS (")
 
         # Format columns
@@ -1604,15 +1679,13 @@ class MySQLDialect(
             if col.ordinality:
                 column_parts.append(f"{self.format_identifier(col.name)} FOR ORDINALITY")
             elif col.exists:
-                escaped_col_path = self._escape_sql_string(col.path) if col.path else ""
                 column_parts.append(
-                    f"{self.format_identifier(col.name)} {col.type} EXISTS PATH '{escaped_col_path}'"
+                    f"{self.format_identifier(col.name)} {col.type} EXISTS PATH {json_path(col.path or '')}"
                 )
             else:
                 col_def = f"{self.format_identifier(col.name)} {col.type}"
                 if col.path:
-                    escaped_col_path = self._escape_sql_string(col.path)
-                    col_def += f" PATH '{escaped_col_path}'"
+                    col_def += f" PATH {json_path(col.path)}"
                 if col.error_handling:
                     if col.error_handling.upper() == 'DEFAULT':
                         col_def += f" DEFAULT {col.default_value} ON ERROR"
@@ -1622,16 +1695,14 @@ class MySQLDialect(
 
         # Format nested paths
         for nested in expr.nested_paths:
-            escaped_nested_path = self._escape_sql_string(nested.path)
-            nested_def = f"NESTED PATH '{escaped_nested_path}' COLUMNS ("
+            nested_def = f"NESTED PATH {json_path(nested.path)} COLUMNS ("
             nested_cols = []
             for col in nested.columns:
                 if col.ordinality:
                     nested_cols.append(f"{self.format_identifier(col.name)} FOR ORDINALITY")
                 else:
-                    escaped_nested_col_path = self._escape_sql_string(col.path) if col.path else ""
                     nested_cols.append(
-                        f"{self.format_identifier(col.name)} {col.type} PATH '{escaped_nested_col_path}'"
+                        f"{self.format_identifier(col.name)} {col.type} PATH {json_path(col.path or '')}"
                     )
             nested_def += ", ".join(nested_cols) + ")"
             if nested.alias:
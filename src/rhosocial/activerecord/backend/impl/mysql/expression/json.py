@@ -80,7 +80,7 @@ class MySQLJSONObjectExpression(AliasableMixin, SQLValueExpression):
     def _convert_to_pairs(self, data: Any) -> List[tuple]:
         """Convert dict or iterable to list of key-value tuples."""
         if isinstance(data, dict):
-            return [(k, v) for k, v in data.items()]
+            return list(data.items())
         return list(data)
 
     def to_sql(self) -> "SQLQueryAndParams":
@@ -69,8 +69,7 @@ def json_extract(
     doc_expr = _convert_to_expression(dialect, json_doc)
     path_expr = core.Literal(dialect, path)
     args = [doc_expr, path_expr]
-    for p in paths:
-        args.append(core.Literal(dialect, p))
+    args.extend(core.Literal(dialect, p) for p in paths)
     return core.FunctionCall(dialect, "JSON_EXTRACT", *args)
 
 
@@ -120,9 +119,7 @@ def json_object(
     """
     if not key_value_pairs:
         return core.FunctionCall(dialect, "JSON_OBJECT")
-    args = []
-    for _i, val in enumerate(key_value_pairs):
-        args.append(core.Literal(dialect, val))
+    args = [core.Literal(dialect, val) for val in key_value_pairs]
     return core.FunctionCall(dialect, "JSON_OBJECT", *args)
 
 
@@ -210,10 +207,9 @@ def json_set(
     """
     doc_expr = _convert_to_expression(dialect, json_doc)
     args = [doc_expr, core.Literal(dialect, path), core.Literal(dialect, value)]
-    for i in range(0, len(path_value_pairs), 2):
-        if i + 1 < len(path_value_pairs):
-            args.append(core.Literal(dialect, path_value_pairs[i]))
-            args.append(core.Literal(dialect, path_value_pairs[i + 1]))
+    # Consume complete path/value pairs in order; a trailing unpaired path is ignored
+    paired = len(path_value_pairs) - len(path_value_pairs) % 2
+    args.extend(core.Literal(dialect, v) for v in path_value_pairs[:paired])
     return core.FunctionCall(dialect, "JSON_SET", *args)
 
 
@@ -241,8 +237,7 @@ def json_remove(
     """
     doc_expr = _convert_to_expression(dialect, json_doc)
     args = [doc_expr, core.Literal(dialect, path)]
-    for p in paths:
-        args.append(core.Literal(dialect, p))
+    args.extend(core.Literal(dialect, p) for p in paths)
     return core.FunctionCall(dialect, "JSON_REMOVE", *args)
 
 
@@ -25,6 +25,7 @@ Design principle: Sync and Async are separate and cannot coexist.
 """
 
 import copy
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from rhosocial.activerecord.backend.introspection.base import (
@@ -61,6 +62,14 @@ from .status_introspector import (
 )
 
 
+@lru_cache(maxsize=512)
+def _base_data_type(column_type: str) -> str:
+    """Return the lower-cased base type of a COLUMN_TYPE, e.g. ``varchar`` for
+    ``VARCHAR(255)``. Schemas reuse a small set of type strings, so results
+    are memoized."""
+    return column_type.split("(")[0].lower()
+
+
 class MySQLIntrospectorMixin(IntrospectorMixin):
     """Mixin providing shared MySQL-specific introspection logic.
 
@@ -138,32 +147,36 @@ class MySQLIntrospectorMixin(IntrospectorMixin):
         schema: str,
     ) -> List[ColumnInfo]:
         columns = []
+        # Bound once; the loop body runs per column of every introspected table
+        add_column = columns.append
         for row in rows:
+            get = row.get
             nullable = (
                 ColumnNullable.NULLABLE
-                if row.get("IS_NULLABLE") == "YES"
+                if get("IS_NULLABLE") == "YES"
                 else ColumnNullable.NOT_NULL
             )
-            col_type = row.get("COLUMN_TYPE") or row.get("DATA_TYPE") or "VARCHAR"
-            columns.append(
+            col_type = get("COLUMN_TYPE") or get("DATA_TYPE") or "VARCHAR"
+            column_key = get("COLUMN_KEY")
+            add_column(
                 ColumnInfo(
                     name=row["COLUMN_NAME"],
                     table_name=table_name,
                     schema=schema,
                     ordinal_position=row["ORDINAL_POSITION"],
-                    data_type=col_type.split("(")[0].lower(),
+                    data_type=_base_data_type(col_type),
                     data_type_full=col_type,
                     nullable=nullable,
-                    default_value=row.get("COLUMN_DEFAULT"),
-                    is_primary_key=row.get("COLUMN_KEY") == "PRI",
-                    is_unique=row.get("COLUMN_KEY") == "UNI",
-                    is_auto_increment="auto_increment" in (row.get("EXTRA") or "").lower(),
-                    comment=row.get("COLUMN_COMMENT"),
-                    character_maximum_length=row.get("CHARACTER_MAXIMUM_LENGTH"),
-                    numeric_precision=row.get("NUMERIC_PRECISION"),
-                    numeric_scale=row.get("NUMERIC_SCALE"),
-                    charset=row.get("CHARACTER_SET_NAME"),
-                    collation=row.get("COLLATION_NAME"),
+                    default_value=get("COLUMN_DEFAULT"),
+                    is_primary_key=column_key == "PRI",
+                    is_unique=column_key == "UNI",
+                    is_auto_increment="auto_increment" in (get("EXTRA") or "").lower(),
+                    comment=get("COLUMN_COMMENT"),
+                    character_maximum_length=get("CHARACTER_MAXIMUM_LENGTH"),
+                    numeric_precision=get("NUMERIC_PRECISION"),
+                    numeric_scale=get("NUMERIC_SCALE"),
+                    charset=get("CHARACTER_SET_NAME"),
+                    collation=get("COLLATION_NAME"),
                 )
             )
         return columns
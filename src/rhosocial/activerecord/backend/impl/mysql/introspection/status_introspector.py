@@ -134,6 +134,9 @@ MYSQL_STATUS_VARIABLES = [
     ("Innodb_rows_deleted", StatusCategory.PERFORMANCE, "Rows deleted", "rows"),
 ]
 
+# Lower-cased SHOW VARIABLES values that mean a boolean setting is enabled
+_ENABLED_VALUES = frozenset({"on", "1"})
+
 
 class MySQLStatusIntrospectorMixin:
     """Mixin providing shared MySQL status introspection logic."""
@@ -149,6 +152,14 @@ class MySQLStatusIntrospectorMixin:
         if isinstance(value, int):
             return value
         if isinstance(value, str):
+            if value.isdecimal():
+                return int(value)
+            # Most remaining values (ON/OFF, paths, names) cannot parse as an
+            # integer; only try int() when the leading character allows it so
+            # the common case does not build and discard a ValueError.
+            first = value[:1]
+            if not (first.isdecimal() or first in ("+", "-") or first.isspace()):
+                return value
             try:
                 return int(value)
             except ValueError:
@@ -633,7 +644,7 @@ class SyncMySQLStatusIntrospector(
                     key = row.get("Variable_name")
                     value = row.get("Value")
                     if key == "log_bin":
-                        binary_log.log_enabled = str(value).lower() in ("on", "1")
+                        binary_log.log_enabled = str(value).lower() in _ENABLED_VALUES
                     elif key == "binlog_format":
                         binary_log.log_format = value
         except Exception:
@@ -762,15 +773,15 @@ class SyncMySQLStatusIntrospector(
                     key = row.get("Variable_name")
                     value = row.get("Value")
                     if key == "slow_query_log":
-                        slow_query.slow_query_log = str(value).lower() in ("on", "1")
+                        slow_query.slow_query_log = str(value).lower() in _ENABLED_VALUES
                     elif key == "slow_query_log_file":
                         slow_query.slow_query_log_file = value
                     elif key == "long_query_time":
                         slow_query.long_query_time = float(value) if value else 10
                     elif key == "log_queries_not_using_indexes":
-                        slow_query.log_queries_not_using_indexes = str(value).lower() in ("on", "1")
+                        slow_query.log_queries_not_using_indexes = str(value).lower() in _ENABLED_VALUES
                     elif key == "log_slow_admin_statements":
-                        slow_query.log_slow_admin_statements = str(value).lower() in ("on", "1")
+                        slow_query.log_slow_admin_statements = str(value).lower() in _ENABLED_VALUES
                     elif key == "min_examined_row_limit":
                         slow_query.min_examined_row_limit = self._parse_variable_value(value)
         except Exception:
@@ -814,7 +825,7 @@ class SyncMySQLStatusIntrospector(
             if result and result.data:
                 for row in result.data:
                     if row.get("Variable_name") == "log_bin":
-                        log_bin_enabled = str(row.get("Value")).lower() in ("on", "1")
+                        log_bin_enabled = str(row.get("Value")).lower() in _ENABLED_VALUES
                         break
         except Exception:
             pass
@@ -1299,7 +1310,7 @@ class AsyncMySQLStatusIntrospector(
                     key = row.get("Variable_name")
                     value = row.get("Value")
                     if key == "log_bin":
-                        binary_log.log_enabled = str(value).lower() in ("on", "1")
+                        binary_log.log_enabled = str(value).lower() in _ENABLED_VALUES
                     elif key == "binlog_format":
                         binary_log.log_format = value
         except Exception:
@@ -1416,7 +1427,7 @@ class AsyncMySQLStatusIntrospector(
                     key = row.get("Variable_name")
                     value = row.get("Value")
                     if key == "slow_query_log":
-                        slow_query.slow_query_log_enabled = str(value).lower() in ("on", "1")
+                        slow_query.slow_query_log_enabled = str(value).lower() in _ENABLED_VALUES
                     elif key == "slow_query_log_file":
                         slow_query.slow_query_log_file = value
         except Exception:
@@ -1466,7 +1477,7 @@ class AsyncMySQLStatusIntrospector(
             if result and result.data:
                 for row in result.data:
                     if row.get("Variable_name") == "log_bin":
-                        log_bin_enabled = str(row.get("Value")).lower() in ("on", "1")
+                        log_bin_enabled = str(row.get("Value")).lower() in _ENABLED_VALUES
                         break
         except Exception:
             pass
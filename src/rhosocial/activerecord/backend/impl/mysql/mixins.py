@@ -1,10 +1,17 @@
 """MySQL dialect-specific Mixin implementations."""
 import logging
+import re
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from uuid import UUID
 from typing import Any, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
 
+from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
 from rhosocial.activerecord.backend.type_adapter import SQLTypeAdapter
 from rhosocial.activerecord.backend.protocols import ConcurrencyHint
-from rhosocial.activerecord.backend.transaction import IsolationLevel
+from rhosocial.activerecord.backend.transaction import IsolationLevel, IsolationLevelError
 
 if TYPE_CHECKING:
     from rhosocial.activerecord.backend.introspection.types import IntrospectionScope
@@ -19,6 +26,94 @@ if TYPE_CHECKING:
         TriggerListExpression,
     )
 
+def _pack_version(version: Tuple[int, ...]) -> int:
+    """Pack a (major, minor, patch) version into one comparable integer.
+
+    ``(8, 0, 18)`` becomes ``8_000_018``, so version gates are a single
+    integer comparison instead of an element-wise tuple comparison.
+    """
+    major, minor, patch = (tuple(version) + (0, 0, 0))[:3]
+    return major * 1_000_000 + minor * 1_000 + patch
+
+
+# Packed server versions used by the version gates in the dialect and mixins
+_MYSQL_5_0_2 = _pack_version((5, 0, 2))
+_MYSQL_5_1_0 = _pack_version((5, 1, 0))
+_MYSQL_5_6_0 = _pack_version((5, 6, 0))
+_MYSQL_5_6_5 = _pack_version((5, 6, 5))
+_MYSQL_5_7_0 = _pack_version((5, 7, 0))
+_MYSQL_5_7_5 = _pack_version((5, 7, 5))
+_MYSQL_5_7_8 = _pack_version((5, 7, 8))
+_MYSQL_5_7_9 = _pack_version((5, 7, 9))
+_MYSQL_8_0_0 = _pack_version((8, 0, 0))
+_MYSQL_8_0_3 = _pack_version((8, 0, 3))
+_MYSQL_8_0_4 = _pack_version((8, 0, 4))
+_MYSQL_8_0_14 = _pack_version((8, 0, 14))
+_MYSQL_8_0_16 = _pack_version((8, 0, 16))
+_MYSQL_8_0_17 = _pack_version((8, 0, 17))
+_MYSQL_8_0_18 = _pack_version((8, 0, 18))
+_MYSQL_8_0_21 = _pack_version((8, 0, 21))
+_MYSQL_8_0_31 = _pack_version((8, 0, 31))
+_MYSQL_9_0_0 = _pack_version((9, 0, 0))
+_MYSQL_9_0_1 = _pack_version((9, 0, 1))
+
+# Leading keyword of a SQL statement, and the keywords that classify it when
+# execute() is called without ExecutionOptions
+_LEADING_KEYWORD = re.compile(r"\s*([A-Za-z]+)")
+_DQL_KEYWORDS = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "PRAGMA", "EXPLAIN"})
+_DML_KEYWORDS = frozenset({"INSERT", "UPDATE", "DELETE", "REPLACE"})
+
+# Connection keyword arguments that backends fold into MySQLConnectionConfig
+# when no connection_config is given
+_MYSQL_CONFIG_PARAMS = (
+    'host', 'port', 'database', 'username', 'password',
+    'charset', 'collation', 'timezone', 'version',
+    'pool_size', 'pool_timeout', 'pool_name', 'pool_reset_session', 'pool_pre_ping',
+    'ssl_ca', 'ssl_cert', 'ssl_key', 'ssl_verify_cert', 'ssl_verify_identity',
+    'log_queries', 'log_level',
+    'auth_plugin', 'autocommit', 'init_command', 'connect_timeout',
+    'read_timeout', 'write_timeout', 'use_pure', 'get_warnings',
+    'raise_on_warnings', 'buffered', 'raw', 'consume_results',
+    'force_ipv6', 'option_files', 'option_groups', 'use_unicode',
+    'sql_mode', 'time_zone', 'sql_log_off',
+    'compress', 'allow_local_infile', 'conn_attrs',
+    'client_flags', 'unix_socket',
+    'allow_local_infile_in_path', 'dsn',
+)
+
+
+@lru_cache(maxsize=64)
+def _placeholder_list(count: int) -> str:
+    """Return ``count`` comma-separated ``%s`` placeholders.
+
+    JSON function argument counts are small and repeat, so the joined
+    string is built once per count.
+    """
+    return ', '.join(['%s'] * count)
+
+
+# Single-pass escaping of quoted LOAD DATA string fragments
+_LOAD_DATA_STRING_ESCAPES = str.maketrans({"\\": "\\\\", "'": "\\'"})
+
+
+# MySQL isolation level keywords, shared by the dialect and the transaction managers
+_MYSQL_ISOLATION_LEVELS: Dict[IsolationLevel, str] = {
+    IsolationLevel.READ_UNCOMMITTED: "READ UNCOMMITTED",
+    IsolationLevel.READ_COMMITTED: "READ COMMITTED",
+    IsolationLevel.REPEATABLE_READ: "REPEATABLE READ",
+    IsolationLevel.SERIALIZABLE: "SERIALIZABLE",
+}
+
+def _escape_load_data_string(value: str) -> str:
+    """Escape a quoted LOAD DATA string fragment.
+
+    Most paths and delimiters contain neither a quote nor a backslash, so
+    the membership probes let them through without building a new string.
+    """
+    if "'" in value or "\\" in value:
+        return value.translate(_LOAD_DATA_STRING_ESCAPES)
+    return value
+
 
 class MySQLIntrospectionMixin:
     """MySQL introspection capability declaration and query formatting.
@@ -335,12 +430,11 @@ class MySQLTransactionMixin:
     MySQL transaction managers.
     """
 
-    _ISOLATION_LEVELS: Dict[IsolationLevel, str] = {
-        IsolationLevel.READ_UNCOMMITTED: "READ UNCOMMITTED",
-        IsolationLevel.READ_COMMITTED: "READ COMMITTED",
-        IsolationLevel.REPEATABLE_READ: "REPEATABLE READ",
-        IsolationLevel.SERIALIZABLE: "SERIALIZABLE"
-    }
+    _ISOLATION_LEVELS: Dict[IsolationLevel, str] = _MYSQL_ISOLATION_LEVELS
+
+    # Complete SET TRANSACTION statements per class, stored with the
+    # _ISOLATION_LEVELS table they were built from so overrides are honored
+    _set_isolation_sql_cache: Dict[type, Tuple[Dict[IsolationLevel, str], Dict[IsolationLevel, str]]] = {}
 
     @property
     def isolation_level(self) -> Optional[IsolationLevel]:
@@ -350,7 +444,6 @@ class MySQLTransactionMixin:
     @isolation_level.setter
     def isolation_level(self, level: Optional[IsolationLevel]):
         """Set transaction isolation level."""
-        from rhosocial.activerecord.backend.transaction import IsolationLevelError
         self.log(logging.DEBUG, f"Setting isolation level to {level}")
         if self.is_active:
             self.log(logging.ERROR, "Cannot change isolation level during active transaction")
@@ -376,11 +469,18 @@ class MySQLTransactionMixin:
         Raises:
             IsolationLevelError: If the isolation level is not supported.
         """
-        from rhosocial.activerecord.backend.transaction import IsolationLevelError
-        level_str = self._ISOLATION_LEVELS.get(level)
-        if not level_str:
+        levels = self._ISOLATION_LEVELS
+        cached = self._set_isolation_sql_cache.get(type(self))
+        if cached is None or cached[0] is not levels:
+            cached = (levels, {
+                level_key: f"SET TRANSACTION ISOLATION LEVEL {level_str}"
+                for level_key, level_str in levels.items()
+            })
+            self._set_isolation_sql_cache[type(self)] = cached
+        sql = cached[1].get(level)
+        if sql is None:
             raise IsolationLevelError(f"Unsupported isolation level: {level}")
-        return f"SET TRANSACTION ISOLATION LEVEL {level_str}", ()
+        return sql, ()
 
 
 class MySQLBackendMixin:
@@ -397,6 +497,34 @@ class MySQLBackendMixin:
     - self._logger: Logger instance
     """
 
+    # Desired Python type to DB driver type mappings for get_default_adapter_suggestions().
+    # This list reflects types seen in test fixtures and common usage,
+    # along with their preferred database-compatible Python types for the driver.
+    # Types that are natively compatible with the DB driver (e.g., Python str, int, float)
+    # and for which no specific conversion logic is needed are omitted from this list.
+    # The consuming layer should assume pass-through behavior for any Python type
+    # that does not have an explicit adapter suggestion.
+    #
+    # Exception: If a user requires specific processing for a natively compatible type
+    # (e.g., custom serialization/deserialization for JSON strings beyond basic conversion),
+    # they would need to implement and register their own specialized adapter.
+    # This backend's default suggestions do not cater to such advanced processing needs.
+    _DEFAULT_ADAPTER_TYPE_MAPPINGS: Tuple[Tuple[Type, Type], ...] = (
+        (bool, int),        # Python bool -> DB driver int (MySQL TINYINT)
+        # Why str for date/time?
+        # MySQL accepts string representations of dates/times and converts them appropriately.
+        (datetime, str),    # Python datetime -> DB driver str (MySQL DATETIME/TIMESTAMP)
+        (date, str),        # Python date -> DB driver str (MySQL DATE)
+        (time, str),        # Python time -> DB driver str (MySQL TIME)
+        (Decimal, float),   # Python Decimal -> DB driver float (MySQL DECIMAL)
+        (UUID, str),        # Python UUID -> DB driver str (MySQL CHAR/VARCHAR/BINARY)
+        (dict, str),        # Python dict -> DB driver str (MySQL TEXT for JSON)
+        (list, str),        # Python list -> DB driver str (MySQL TEXT for JSON)
+        (Enum, str),        # Python Enum -> DB driver str (MySQL TEXT/VARCHAR)
+        (set, str),         # Python set -> DB driver str (MySQL SET)
+        (frozenset, str),   # Python frozenset -> DB driver str (MySQL SET)
+    )
+
     def _register_mysql_adapters(self):
         """Register MySQL-specific type adapters."""
         from .adapters import (
@@ -469,7 +597,6 @@ class MySQLBackendMixin:
         Args:
             _returning_clause: Unused parameter (MySQL doesn't support RETURNING).
         """
-        from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
         # MySQL does not support RETURNING clause
         if self.dialect.supports_returning_clause():
             return True
@@ -498,43 +625,10 @@ class MySQLBackendMixin:
             tuples containing a `SQLTypeAdapter` instance and the target
             Python type (`TypeRegistry`'s `db_type`) expected by the driver.
         """
-        from datetime import date, datetime, time
-        from decimal import Decimal
-        from uuid import UUID
-        from enum import Enum
-
         suggestions: Dict[Type, Tuple[SQLTypeAdapter, Type]] = {}
 
-        # Define a list of desired Python type to DB driver type mappings.
-        # This list reflects types seen in test fixtures and common usage,
-        # along with their preferred database-compatible Python types for the driver.
-        # Types that are natively compatible with the DB driver (e.g., Python str, int, float)
-        # and for which no specific conversion logic is needed are omitted from this list.
-        # The consuming layer should assume pass-through behavior for any Python type
-        # that does not have an explicit adapter suggestion.
-        #
-        # Exception: If a user requires specific processing for a natively compatible type
-        # (e.g., custom serialization/deserialization for JSON strings beyond basic conversion),
-        # they would need to implement and register their own specialized adapter.
-        # This backend's default suggestions do not cater to such advanced processing needs.
-        type_mappings = [
-            (bool, int),        # Python bool -> DB driver int (MySQL TINYINT)
-            # Why str for date/time?
-            # MySQL accepts string representations of dates/times and converts them appropriately.
-            (datetime, str),    # Python datetime -> DB driver str (MySQL DATETIME/TIMESTAMP)
-            (date, str),        # Python date -> DB driver str (MySQL DATE)
-            (time, str),        # Python time -> DB driver str (MySQL TIME)
-            (Decimal, float),   # Python Decimal -> DB driver float (MySQL DECIMAL)
-            (UUID, str),        # Python UUID -> DB driver str (MySQL CHAR/VARCHAR/BINARY)
-            (dict, str),        # Python dict -> DB driver str (MySQL TEXT for JSON)
-            (list, str),        # Python list -> DB driver str (MySQL TEXT for JSON)
-            (Enum, str),        # Python Enum -> DB driver str (MySQL TEXT/VARCHAR)
-            (set, str),         # Python set -> DB driver str (MySQL SET)
-            (frozenset, str),   # Python frozenset -> DB driver str (MySQL SET)
-        ]
-
         # Iterate through the defined mappings and retrieve adapters from the registry.
-        for py_type, db_type in type_mappings:
+        for py_type, db_type in self._DEFAULT_ADAPTER_TYPE_MAPPINGS:
             adapter = self.adapter_registry.get_adapter(py_type, db_type)
             if adapter:
                 suggestions[py_type] = (adapter, db_type)
@@ -550,8 +644,9 @@ class MySQLBackendMixin:
 
     def log(self, level: int, message: str):
         """Log a message with the specified level."""
-        if hasattr(self, '_logger') and self._logger:
-            self._logger.log(level, message)
+        logger = getattr(self, '_logger', None)
+        if logger:
+            logger.log(level, message)
         else:
             # Fallback logging
             print(f"[{logging.getLevelName(level)}] {message}")
@@ -566,6 +661,18 @@ class MySQLBackendMixin:
         2055,  # CR_SERVER_LOST_EXTENDED - Lost connection to MySQL server
     }
 
+    # Server error codes classified by _handle_error. Message matching stays
+    # as the fallback for errors raised without an errno.
+    ER_DUP_ENTRY = 1062  # Duplicate entry for key
+    ER_FOREIGN_KEY_CODES = frozenset({
+        1216,  # ER_NO_REFERENCED_ROW - Cannot add or update a child row
+        1217,  # ER_ROW_IS_REFERENCED - Cannot delete or update a parent row
+        1451,  # ER_ROW_IS_REFERENCED_2 - Cannot delete or update a parent row
+        1452,  # ER_NO_REFERENCED_ROW_2 - Cannot add or update a child row
+    })
+    ER_LOCK_DEADLOCK = 1213  # Deadlock found when trying to get lock
+    ER_LOCK_WAIT_TIMEOUT = 1205  # Lock wait timeout exceeded
+
     def _is_connection_error(self, error: Exception) -> bool:
         """Check if an error indicates a connection loss.
 
@@ -579,9 +686,8 @@ class MySQLBackendMixin:
             True if the error indicates a connection problem, False otherwise
         """
         # Check for MySQL error codes
-        if hasattr(error, 'errno'):
-            if error.errno in self.CONNECTION_ERROR_CODES:
-                return True
+        if getattr(error, 'errno', None) in self.CONNECTION_ERROR_CODES:
+            return True
 
         # Fallback to string matching for error messages
         error_str = str(error).lower()
@@ -615,28 +721,36 @@ class MySQLBackendMixin:
         )
 
         error_msg = str(error)
+        errno = getattr(error, 'errno', None)
 
         if isinstance(error, MySQLIntegrityError):
-            if "Duplicate entry" in error_msg:
+            if errno == self.ER_DUP_ENTRY or "Duplicate entry" in error_msg:
                 self.log(logging.ERROR, f"Unique constraint violation: {error_msg}")
                 raise IntegrityError(f"Unique constraint violation: {error_msg}")
-            elif "Cannot delete or update" in error_msg or "a foreign key constraint fails" in error_msg:
+            elif (errno in self.ER_FOREIGN_KEY_CODES
+                  or "Cannot delete or update" in error_msg
+                  or "a foreign key constraint fails" in error_msg):
                 self.log(logging.ERROR, f"Foreign key constraint violation: {error_msg}")
                 raise IntegrityError(f"Foreign key constraint violation: {error_msg}")
             self.log(logging.ERROR, f"Integrity error: {error_msg}")
             raise IntegrityError(error_msg)
-        elif isinstance(error, MySQLDatabaseError):
-            if "Deadlock found" in error_msg:
-                self.log(logging.ERROR, f"Deadlock error: {error_msg}")
-                raise DeadlockError(error_msg)
-            self.log(logging.ERROR, f"Database error: {error_msg}")
-            raise DatabaseError(error_msg)
+        # OperationalError subclasses DatabaseError, and the driver raises lock
+        # wait timeouts (SQLSTATE HY000) as a plain DatabaseError, so lock
+        # errors are matched by errno first and the subclass before its base.
+        elif isinstance(error, MySQLDatabaseError) and (
+                errno == self.ER_LOCK_DEADLOCK or "Deadlock found" in error_msg):
+            self.log(logging.ERROR, f"Deadlock error: {error_msg}")
+            raise DeadlockError(error_msg)
+        elif isinstance(error, MySQLDatabaseError) and (
+                errno == self.ER_LOCK_WAIT_TIMEOUT or "Lock wait timeout exceeded" in error_msg):
+            self.log(logging.ERROR, f"Lock timeout error: {error_msg}")
+            raise OperationalError(error_msg)
         elif isinstance(error, MySQLOperationalError):
-            if "Lock wait timeout exceeded" in error_msg:
-                self.log(logging.ERROR, f"Lock timeout error: {error_msg}")
-                raise OperationalError(error_msg)
             self.log(logging.ERROR, f"Operational error: {error_msg}")
             raise OperationalError(error_msg)
+        elif isinstance(error, MySQLDatabaseError):
+            self.log(logging.ERROR, f"Database error: {error_msg}")
+            raise DatabaseError(error_msg)
         elif isinstance(error, MySQLError):
             self.log(logging.ERROR, f"MySQL error: {error_msg}")
             raise DatabaseError(error_msg)
@@ -654,11 +768,15 @@ class MySQLTriggerMixin:
     - No WHEN condition
     - No REFERENCING clause
     - Single event per trigger
+
+    This mixin assumes the following attributes exist in the class, as set
+    by MySQLDialect.__init__:
+    - self._version_int: server version packed with _pack_version
     """
 
     def supports_trigger(self) -> bool:
         """MySQL supports triggers since 5.0.2."""
-        return self.version >= (5, 0, 2)
+        return self._version_int >= _MYSQL_5_0_2
 
     def supports_instead_of_trigger(self) -> bool:
         """MySQL does NOT support INSTEAD OF triggers."""
@@ -678,7 +796,7 @@ class MySQLTriggerMixin:
 
     def supports_trigger_if_not_exists(self) -> bool:
         """MySQL 5.7+ supports IF NOT EXISTS."""
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def format_create_trigger_statement(self, expr) -> Tuple[str, tuple]:
         """Format CREATE TRIGGER statement (MySQL syntax).
@@ -690,7 +808,6 @@ class MySQLTriggerMixin:
         - Does not support REFERENCING clause
         - Uses trigger body directly instead of function call
         """
-        from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
 
         if expr.timing.value == "INSTEAD OF":
             raise UnsupportedFeatureError(
@@ -969,10 +1086,7 @@ class MySQLTableMixin:
         Returns:
             Formatted storage options string (e.g., "ENGINE=InnoDB DEFAULT CHARSET=utf8mb4")
         """
-        parts = []
-        for key, value in storage_options.items():
-            parts.append(f"{key}={value}")
-        return ' '.join(parts)
+        return ' '.join(f"{key}={value}" for key, value in storage_options.items())
 
 
 class MySQLSetTypeMixin:
@@ -1060,14 +1174,11 @@ class MySQLSetTypeMixin:
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
-        conditions = []
-        params: List[str] = []
-
-        for value in values:
-            conditions.append(f"FIND_IN_SET(%s, {self.format_identifier(column)}) > 0")
-            params.append(value)
-
-        return " AND ".join(conditions), tuple(params)
+        # Every value is a plain bound parameter, so the values themselves are
+        # the parameter tuple; tuple() returns a tuple argument unchanged.
+        params = tuple(values)
+        condition = f"FIND_IN_SET(%s, {self.format_identifier(column)}) > 0"
+        return " AND ".join([condition] * len(params)), params
 
 
 class MySQLJSONFunctionMixin:
@@ -1092,34 +1203,40 @@ class MySQLJSONFunctionMixin:
     - JSON_MERGE_PATCH: MySQL 8.0.3+
     - JSON_TABLE: MySQL 8.0.4+
     - JSON_VALUE: MySQL 8.0.21+
+
+    This mixin assumes the following attributes exist in the class, as set
+    by MySQLDialect.__init__:
+    - self._version_int: server version packed with _pack_version
+    - self._supports_json: whether the server version is 5.7.8 or later
     """
 
-    # Function version requirements
+    # Function version requirements as packed versions
     _JSON_FUNCTION_VERSIONS = {
-        'JSON_TABLE': (8, 0, 4),
-        'JSON_VALUE': (8, 0, 21),
-        'JSON_SCHEMA_VALID': (8, 0, 17),
-        'JSON_MERGE_PATCH': (8, 0, 3),
+        'JSON_TABLE': _MYSQL_8_0_4,
+        'JSON_VALUE': _MYSQL_8_0_21,
+        'JSON_SCHEMA_VALID': _MYSQL_8_0_17,
+        'JSON_MERGE_PATCH': _MYSQL_8_0_3,
     }
 
     def supports_json_type(self) -> bool:
         """MySQL supports JSON data type since 5.7.8."""
-        return self.version >= (5, 7, 8)
+        return self._supports_json
 
     def supports_json_merge_patch(self) -> bool:
         """MySQL supports JSON_MERGE_PATCH since 8.0.3."""
-        return self.version >= (8, 0, 3)
+        return self._version_int >= _MYSQL_8_0_3
 
     def supports_json_table(self) -> bool:
         """MySQL supports JSON_TABLE since 8.0.4."""
-        return self.version >= (8, 0, 4)
+        return self._version_int >= _MYSQL_8_0_4
 
     def supports_json_function(self, function_name: str) -> bool:
         """Check if specific JSON function is supported."""
-        if function_name in self._JSON_FUNCTION_VERSIONS:
-            return self.version >= self._JSON_FUNCTION_VERSIONS[function_name]
+        min_version = self._JSON_FUNCTION_VERSIONS.get(function_name)
+        if min_version is not None:
+            return self._version_int >= min_version
         # Basic JSON functions are supported since 5.7.8
-        return self.version >= (5, 7, 8)
+        return self._supports_json
 
     def format_json_extract(
         self,
@@ -1128,12 +1245,9 @@ class MySQLJSONFunctionMixin:
         paths: Optional[List[str]] = None
     ) -> Tuple[str, tuple]:
         """Format JSON_EXTRACT function."""
-        all_paths = [path]
-        if paths:
-            all_paths.extend(paths)
-
-        path_placeholders = ', '.join(['%s' for _ in all_paths])
-        return f"JSON_EXTRACT({json_doc}, {path_placeholders})", tuple(all_paths)
+        all_paths = (path, *paths) if paths else (path,)
+        path_placeholders = _placeholder_list(len(all_paths))
+        return f"JSON_EXTRACT({json_doc}, {path_placeholders})", all_paths
 
     def format_json_unquote(self, json_val: str) -> Tuple[str, tuple]:
         """Format JSON_UNQUOTE function."""
@@ -1147,23 +1261,20 @@ class MySQLJSONFunctionMixin:
         if not key_value_pairs:
             return "JSON_OBJECT()", ()
 
-        parts = []
         params: List[Any] = []
-
+        add_params = params.extend
         for key, value in key_value_pairs:
-            parts.append('%s')
-            parts.append('%s')
-            params.append(key)
-            params.append(value)
+            add_params((key, value))
 
-        return f"JSON_OBJECT({', '.join(parts)})", tuple(params)
+        placeholders = _placeholder_list(len(params))
+        return f"JSON_OBJECT({placeholders})", tuple(params)
 
     def format_json_array(self, values: List[Any]) -> Tuple[str, tuple]:
         """Format JSON_ARRAY function."""
         if not values:
             return "JSON_ARRAY()", ()
 
-        placeholders = ', '.join(['%s' for _ in values])
+        placeholders = _placeholder_list(len(values))
         return f"JSON_ARRAY({placeholders})", tuple(values)
 
     def format_json_contains(
@@ -1189,16 +1300,13 @@ class MySQLJSONFunctionMixin:
         if path_value_pairs:
             all_pairs.extend(path_value_pairs)
 
-        parts = []
         params: List[Any] = []
-
+        add_params = params.extend
         for p, v in all_pairs:
-            parts.append('%s')
-            parts.append('%s')
-            params.append(p)
-            params.append(v)
+            add_params((p, v))
 
-        return f"JSON_SET({json_doc}, {', '.join(parts)})", tuple(params)
+        placeholders = _placeholder_list(len(params))
+        return f"JSON_SET({json_doc}, {placeholders})", tuple(params)
 
     def format_json_remove(
         self,
@@ -1207,12 +1315,9 @@ class MySQLJSONFunctionMixin:
         paths: Optional[List[str]] = None
     ) -> Tuple[str, tuple]:
         """Format JSON_REMOVE function."""
-        all_paths = [path]
-        if paths:
-            all_paths.extend(paths)
-
-        path_placeholders = ', '.join(['%s' for _ in all_paths])
-        return f"JSON_REMOVE({json_doc}, {path_placeholders})", tuple(all_paths)
+        all_paths = (path, *paths) if paths else (path,)
+        path_placeholders = _placeholder_list(len(all_paths))
+        return f"JSON_REMOVE({json_doc}, {path_placeholders})", all_paths
 
     def format_json_type(self, json_val: str) -> Tuple[str, tuple]:
         """Format JSON_TYPE function."""
@@ -1305,47 +1410,52 @@ class MySQLSpatialMixin:
     - Basic spatial types: MySQL 5.7+
     - GeoJSON support: MySQL 5.7.5+
     - Improved SRID handling: MySQL 8.0+
+
+    This mixin assumes the following attributes exist in the class, as set
+    by MySQLDialect.__init__:
+    - self._version_int: server version packed with _pack_version
     """
 
+    _SPATIAL_TYPES = frozenset({
+        'GEOMETRY', 'POINT', 'LINESTRING', 'POLYGON',
+        'MULTIPOINT', 'MULTILINESTRING', 'MULTIPOLYGON',
+        'GEOMETRYCOLLECTION'
+    })
+
     def supports_spatial_type(self, type_name: str) -> bool:
         """Check if specific spatial type is supported."""
-        valid_types = {
-            'GEOMETRY', 'POINT', 'LINESTRING', 'POLYGON',
-            'MULTIPOINT', 'MULTILINESTRING', 'MULTIPOLYGON',
-            'GEOMETRYCOLLECTION'
-        }
-        if type_name.upper() not in valid_types:
+        if type_name.upper() not in self._SPATIAL_TYPES:
             return False
         # All spatial types require MySQL 5.7+
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def supports_spatial_index(self) -> bool:
         """Whether SPATIAL indexes are supported."""
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def supports_geojson(self) -> bool:
         """Whether GeoJSON functions are supported."""
-        return self.version >= (5, 7, 5)
+        return self._version_int >= _MYSQL_5_7_5
 
     def supports_geometry_type(self) -> bool:
         """Whether GEOMETRY type is supported."""
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def supports_point_type(self) -> bool:
         """Whether POINT type is supported."""
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def supports_curve_type(self) -> bool:
         """Whether curve types (LINESTRING, MULTILINESTRING) are supported."""
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def supports_surface_type(self) -> bool:
         """Whether surface types (POLYGON, MULTIPOLYGON) are supported."""
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def supports_geometry_collection_type(self) -> bool:
         """Whether GEOMETRYCOLLECTION is supported."""
-        return self.version >= (5, 7, 0)
+        return self._version_int >= _MYSQL_5_7_0
 
     def format_spatial_literal(
         self,
@@ -1384,7 +1494,6 @@ class MySQLSpatialMixin:
     def format_st_as_geojson(self, geom: str) -> Tuple[str, tuple]:
         """Format ST_AsGeoJSON function (MySQL 5.7.5+)."""
         if not self.supports_geojson():
-            from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
             raise UnsupportedFeatureError(self.name, "GeoJSON functions (requires MySQL 5.7.5+)")
         return f"ST_AsGeoJSON({geom})", ()
 
@@ -1420,7 +1529,6 @@ class MySQLSpatialMixin:
     ) -> Tuple[str, tuple]:
         """Format CREATE SPATIAL INDEX statement."""
         if not self.supports_spatial_index():
-            from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
             raise UnsupportedFeatureError(self.name, "SPATIAL indexes (requires MySQL 5.7+)")
         return (
             f"CREATE SPATIAL INDEX {self.format_identifier(index_name)} "
@@ -1443,6 +1551,10 @@ class MySQLVectorMixin:
     Version Requirements:
     - VECTOR type: MySQL 9.0+
     - VECTOR indexes: MySQL 9.0.1+
+
+    This mixin assumes the following attributes exist in the class, as set
+    by MySQLDialect.__init__:
+    - self._version_int: server version packed with _pack_version
     """
 
     # Maximum dimension supported by MySQL 9.0
@@ -1450,11 +1562,11 @@ class MySQLVectorMixin:
 
     def supports_vector_type(self) -> bool:
         """VECTOR type is supported since MySQL 9.0."""
-        return self.version >= (9, 0, 0)
+        return self._version_int >= _MYSQL_9_0_0
 
     def supports_vector_index(self) -> bool:
         """VECTOR indexes are supported since MySQL 9.0.1."""
-        return self.version >= (9, 0, 1)
+        return self._version_int >= _MYSQL_9_0_1
 
     def get_max_vector_dimension(self) -> int:
         """Get maximum supported vector dimension."""
@@ -1590,7 +1702,6 @@ class MySQLVectorMixin:
             Tuple of (SQL string, parameters tuple)
         """
         if not self.supports_vector_index():
-            from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
             raise UnsupportedFeatureError(self.name, "VECTOR indexes (requires MySQL 9.0.1+)")
         # MySQL 9.0.1+ syntax for vector index
         return (
@@ -1634,7 +1745,7 @@ class MySQLDMLOperationMixin:
 
         parts.append("INFILE")
 
-        file_path_escaped = expr.file_path.replace("\\", "\\\\").replace("'", "\\'")
+        file_path_escaped = _escape_load_data_string(expr.file_path)
         parts.append(f"'{file_path_escaped}'")
 
         if expr.options.replace:
@@ -1717,15 +1828,26 @@ class MySQLFullTextSearchMixin:
     - FULLTEXT parser plugins (5.1+)
     - Query expansion mode
     - MATCH ... AGAINST expression
+
+    This mixin assumes the following attributes exist in the class, as set
+    by MySQLDialect.__init__:
+    - self._version_int: server version packed with _pack_version
     """
 
+    # MATCH ... AGAINST search modifiers by mode name
+    _MATCH_MODE_CLAUSES: Dict[str, str] = {
+        "NATURAL_LANGUAGE": "IN NATURAL LANGUAGE MODE",
+        "BOOLEAN": "IN BOOLEAN MODE",
+        "QUERY_EXPANSION": "IN NATURAL LANGUAGE MODE WITH QUERY EXPANSION",
+    }
+
     def supports_fulltext_index(self) -> bool:
         """MySQL 5.6+ supports FULLTEXT for InnoDB."""
-        return self.version >= (5, 6, 0)
+        return self._version_int >= _MYSQL_5_6_0
 
     def supports_fulltext_parser(self) -> bool:
         """MySQL supports FULLTEXT parser plugins."""
-        return self.version >= (5, 1, 0)
+        return self._version_int >= _MYSQL_5_1_0
 
     def supports_fulltext_query_expansion(self) -> bool:
         """MySQL supports QUERY EXPANSION."""
@@ -1769,15 +1891,8 @@ class MySQLFullTextSearchMixin:
         search_params = (search_string,)
 
         if mode:
-            mode_upper = mode.upper()
-            if mode_upper == "NATURAL_LANGUAGE":
-                mode_str = "IN NATURAL LANGUAGE MODE"
-            elif mode_upper == "BOOLEAN":
-                mode_str = "IN BOOLEAN MODE"
-            elif mode_upper == "QUERY_EXPANSION":
-                mode_str = "IN NATURAL LANGUAGE MODE WITH QUERY EXPANSION"
-            else:
-                mode_str = ""
+            # Unknown modes add no modifier
+            mode_str = self._MATCH_MODE_CLAUSES.get(mode.upper(), "")
         else:
             mode_str = "IN NATURAL LANGUAGE MODE"
 
@@ -1794,19 +1909,23 @@ class MySQLLockingMixin:
 
     Note: MySQL does NOT support PostgreSQL's FOR NO KEY UPDATE or
     FOR KEY SHARE lock strengths.
+
+    This mixin assumes the following attributes exist in the class, as set
+    by MySQLDialect.__init__:
+    - self._is_mysql8: whether the server version is 8.0 or later
     """
 
     def supports_for_share(self) -> bool:
         """Whether FOR SHARE clause is supported (MySQL 8.0+)."""
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_for_update_nowait(self) -> bool:
         """Whether FOR UPDATE NOWAIT is supported (MySQL 8.0+)."""
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def supports_for_update_skip_locked(self) -> bool:
         """Whether FOR UPDATE SKIP LOCKED is supported (MySQL 8.0+)."""
-        return self.version >= (8, 0, 0)
+        return self._is_mysql8
 
     def format_for_update_clause(self, clause) -> Tuple[str, tuple]:
         """Format MySQL-specific FOR UPDATE clause.
@@ -1820,7 +1939,6 @@ class MySQLLockingMixin:
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
-        from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
         from rhosocial.activerecord.backend.impl.mysql.expression.locking import MySQLLockStrength
 
         all_params = []
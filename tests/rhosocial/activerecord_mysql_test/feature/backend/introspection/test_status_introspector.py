@@ -241,6 +241,15 @@ class TestMySQLStatusIntrospectorMixin:
         assert result == "utf8mb4"
         assert isinstance(result, str)
 
+    def test_parse_variable_value_signed_and_numeric_prefix(self, mysql_backend):
+        """Test _parse_variable_value keeps int() semantics on the slow path."""
+        status = mysql_backend.introspector.status
+
+        assert status._parse_variable_value("-1") == -1
+        assert status._parse_variable_value(" 7 ") == 7
+        assert status._parse_variable_value("8.0.36") == "8.0.36"
+        assert status._parse_variable_value("") == ""
+
     def test_create_status_item(self, mysql_backend):
         """Test _create_status_item creates proper StatusItem."""
         status = mysql_backend.introspector.status
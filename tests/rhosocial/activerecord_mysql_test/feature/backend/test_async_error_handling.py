@@ -105,6 +105,16 @@ class TestAsyncHandleError:
         with pytest.raises(DeadlockError):
             await backend._handle_error(mock_error)
 
+    @pytest.mark.asyncio
+    async def test_handle_deadlock_error_by_errno(self, async_mysql_backend):
+        """Test that the deadlock error code is classified without the message."""
+        backend = async_mysql_backend
+
+        mock_error = MySQLDatabaseError(msg="Transaction rolled back", errno=1213)
+
+        with pytest.raises(DeadlockError):
+            await backend._handle_error(mock_error)
+
     @pytest.mark.asyncio
     async def test_handle_lock_wait_timeout_error(self, async_mysql_backend):
         """Test that Lock wait timeout error is converted to OperationalError."""
@@ -121,9 +131,40 @@ class TestAsyncHandleError:
 
         mock_error = MockLockTimeoutError()
 
-        # Due to inheritance order in _handle_error, OperationalError that is also
-        # a DatabaseError will be caught by DatabaseError branch
-        with pytest.raises((OperationalError, DatabaseError)):
+        with pytest.raises(OperationalError):
+            await backend._handle_error(mock_error)
+
+    @pytest.mark.asyncio
+    async def test_handle_lock_wait_timeout_error_by_errno(self, async_mysql_backend):
+        """Test that the lock wait timeout code maps to OperationalError."""
+        backend = async_mysql_backend
+
+        # The driver raises 1205 (SQLSTATE HY000) as a plain DatabaseError
+        for mock_error in (
+            MySQLOperationalError(msg="Statement aborted", errno=1205),
+            MySQLDatabaseError(msg="Statement aborted", errno=1205),
+        ):
+            with pytest.raises(OperationalError):
+                await backend._handle_error(mock_error)
+
+    @pytest.mark.asyncio
+    async def test_handle_deadlock_operational_error_by_errno(self, async_mysql_backend):
+        """Test that the deadlock code wins over the OperationalError class."""
+        backend = async_mysql_backend
+
+        mock_error = MySQLOperationalError(msg="Transaction rolled back", errno=1213)
+
+        with pytest.raises(DeadlockError):
+            await backend._handle_error(mock_error)
+
+    @pytest.mark.asyncio
+    async def test_handle_generic_operational_error(self, async_mysql_backend):
+        """Test that an OperationalError is not reported as a plain DatabaseError."""
+        backend = async_mysql_backend
+
+        mock_error = MySQLOperationalError(msg="Server has gone away", errno=2006)
+
+        with pytest.raises(OperationalError):
             await backend._handle_error(mock_error)
 
     @pytest.mark.asyncio
@@ -0,0 +1,107 @@
+# tests/rhosocial/activerecord_mysql_test/feature/backend/test_dialect_explain_caps.py
+"""
+Tests for MySQL dialect EXPLAIN capability detection.
+
+These tests do not require a database connection; they verify that the
+version-dependent EXPLAIN capabilities resolved at dialect construction
+match the documented MySQL version requirements.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from rhosocial.activerecord.backend.impl.mysql.dialect import MySQLDialect
+
+
+@pytest.mark.parametrize("version, expected", [
+    ((5, 7, 44), False),
+    ((8, 0, 17), False),
+    ((8, 0, 18), True),
+    ((9, 0, 0), True),
+])
+def test_supports_explain_analyze(version, expected):
+    """EXPLAIN ANALYZE is available since MySQL 8.0.18."""
+    assert MySQLDialect(version).supports_explain_analyze() is expected
+
+
+@pytest.mark.parametrize("version, fmt, expected", [
+    ((5, 6, 4), "JSON", False),
+    ((5, 6, 5), "json", True),
+    ((8, 0, 15), "TREE", False),
+    ((8, 0, 16), "tree", True),
+    ((5, 5, 0), "TEXT", True),
+    ((8, 0, 0), "XML", False),
+])
+def test_supports_explain_format(version, fmt, expected):
+    """EXPLAIN FORMAT support follows the server version."""
+    assert MySQLDialect(version).supports_explain_format(fmt) is expected
+
+
+def test_explain_caps_are_per_instance():
+    """Dialects with different versions do not share capability state."""
+    old = MySQLDialect((5, 7, 0))
+    new = MySQLDialect((8, 0, 30))
+    assert not old.supports_explain_format("TREE")
+    assert new.supports_explain_format("TREE")
+
+
+def test_explain_formats_are_frozen():
+    """The supported EXPLAIN formats are resolved once as an immutable set."""
+    dialect = MySQLDialect((8, 0, 16))
+    assert dialect._explain_caps.formats == frozenset({"TEXT", "JSON", "TREE"})
+    assert isinstance(dialect._explain_caps.formats, frozenset)
+    assert MySQLDialect((5, 6, 0))._explain_caps.formats == frozenset({"TEXT"})
+
+
+def test_explain_caps_shared_per_version():
+    """Dialects for the same server version reuse one capability profile."""
+    assert MySQLDialect((8, 0, 30))._explain_caps is MySQLDialect((8, 0, 30))._explain_caps
+    assert MySQLDialect((8, 0, 30))._explain_caps is not MySQLDialect((5, 7, 0))._explain_caps
+
+
+@pytest.mark.parametrize("version, window, json_type, json_arrows", [
+    ((5, 7, 8), False, True, False),
+    ((5, 7, 9), False, True, True),
+    ((8, 0, 0), True, True, True),
+])
+def test_feature_gates_resolved_at_init(version, window, json_type, json_arrows):
+    """Window/CTE and JSON gates are fixed when the dialect is constructed."""
+    dialect = MySQLDialect(version)
+    assert dialect.supports_window_functions() is window
+    assert dialect.supports_recursive_cte() is window
+    assert dialect.supports_json_type() is json_type
+    assert dialect.supports_json_arrow_operators() is json_arrows
+
+
+@pytest.mark.parametrize("version, function_name, expected", [
+    ((5, 7, 8), "JSON_EXTRACT", True),
+    ((5, 7, 7), "JSON_EXTRACT", False),
+    ((8, 0, 3), "JSON_TABLE", False),
+    ((8, 0, 4), "JSON_TABLE", True),
+    ((8, 0, 20), "JSON_VALUE", False),
+    ((8, 0, 21), "JSON_VALUE", True),
+])
+def test_supports_json_function_version_gates(version, function_name, expected):
+    """Per-function JSON gates compare against the packed server version."""
+    assert MySQLDialect(version).supports_json_function(function_name) is expected
+
+
+def _explain(options):
+    """Build a minimal EXPLAIN expression stand-in around ``SELECT 1``."""
+    statement = SimpleNamespace(to_sql=lambda: ("SELECT 1", ()))
+    return SimpleNamespace(statement=statement, options=options)
+
+
+@pytest.mark.parametrize("version, options, expected", [
+    ((8, 0, 30), None, "EXPLAIN SELECT 1"),
+    ((9, 0, 0), None, "EXPLAIN FORMAT=TRADITIONAL SELECT 1"),
+    ((8, 0, 30), SimpleNamespace(analyze=False, format="json", type=None), "EXPLAIN FORMAT=JSON SELECT 1"),
+    ((8, 0, 30), SimpleNamespace(analyze=True, format="tree", type=None), "EXPLAIN ANALYZE FORMAT=TREE SELECT 1"),
+    ((8, 0, 30), SimpleNamespace(analyze=True, format=None, type=None), "EXPLAIN ANALYZE SELECT 1"),
+    ((9, 0, 0), SimpleNamespace(analyze=False, format=None, type=None), "EXPLAIN FORMAT=TRADITIONAL SELECT 1"),
+])
+def test_format_explain_statement_shapes(version, options, expected):
+    """Each EXPLAIN shape renders the expected prefix."""
+    sql, params = MySQLDialect(version).format_explain_statement(_explain(options))
+    assert sql == expected
+    assert params == ()
@@ -137,6 +137,21 @@ class TestMySQLFunctionSupportPrivateMethod:
         result = dialect._is_mysql_function_supported("json_extract")
         assert result is True
 
+    def test_subclass_function_versions_are_honored(self):
+        """Test that a subclass overriding the version table gets its own bounds."""
+        class CustomDialect(MySQLDialect):
+            _MYSQL_FUNCTION_VERSIONS = {
+                **MySQLDialect._MYSQL_FUNCTION_VERSIONS,
+                "json_extract": ((8, 0, 0), None),
+                "pow": (None, (5, 7, 99)),
+            }
+
+        old_custom = CustomDialect(version=(5, 7, 8))
+        assert old_custom._is_mysql_function_supported("json_extract") is False
+        assert old_custom._is_mysql_function_supported("pow") is True
+        assert CustomDialect(version=(8, 0, 0))._is_mysql_function_supported("pow") is False
+        assert MySQLDialect(version=(5, 7, 8))._is_mysql_function_supported("json_extract") is True
+
 
 class TestMySQLFunctionSupportIntegration:
     """Integration tests for function support detection."""
@@ -162,3 +177,12 @@ class TestMySQLFunctionSupportIntegration:
 
         assert old_result.get("st_geom_from_text") is False
         assert new_result.get("st_geom_from_text") is True
+
+    def test_function_support_is_shared_per_version(self):
+        """Test that dialects of one version share the resolved map but get copies."""
+        first = MySQLDialect(version=(8, 0, 0)).supports_functions()
+        first["json_extract"] = False
+
+        second = MySQLDialect(version=(8, 0, 0)).supports_functions()
+        assert second["json_extract"] is True
+        assert second is not first
@@ -235,3 +235,25 @@ class TestMySQLEnumAdapter:
         # from_database with None options
         result = adapter.from_database('draft', Status, None)
         assert result == Status.DRAFT
+
+    def test_value_lookup_table_is_reused(self):
+        """Test that repeated string lookups reuse the per-class value table."""
+        adapter = MySQLEnumAdapter()
+
+        assert adapter.from_database('published', Status) == Status.PUBLISHED
+        table = adapter._value_tables[Status]
+        assert adapter.from_database('archived', Status) == Status.ARCHIVED
+        assert adapter._value_tables[Status] is table
+
+        # Name lookup still works as a fallback
+        assert adapter.from_database('DRAFT', Status) == Status.DRAFT
+
+    def test_member_sequence_is_reused(self):
+        """Test that index conversions in both directions share one member tuple."""
+        adapter = MySQLEnumAdapter(use_int_storage=True)
+
+        assert adapter.to_database(Status.PUBLISHED, int) == 2
+        members = adapter._member_sequences[Status]
+        assert members == tuple(Status)
+        assert adapter.from_database(2, Status) == Status.PUBLISHED
+        assert adapter._member_sequences[Status] is members
@@ -48,6 +48,19 @@ class TestFullTextProtocol:
         assert 'IN NATURAL LANGUAGE MODE' in sql
         assert params == ('MySQL',)
 
+    @pytest.mark.parametrize("mode, clause", [
+        ('boolean', 'AGAINST(%s IN BOOLEAN MODE)'),
+        ('QUERY_EXPANSION', 'AGAINST(%s IN NATURAL LANGUAGE MODE WITH QUERY EXPANSION)'),
+        (None, 'AGAINST(%s IN NATURAL LANGUAGE MODE)'),
+    ])
+    def test_format_match_against_modes(self, mode, clause):
+        """Test each search mode maps to its MySQL modifier."""
+        dialect = MySQLDialect(version=(8, 0, 0))
+
+        sql, _ = dialect.format_match_against(['title'], 'MySQL', mode=mode)
+
+        assert sql == f'MATCH(`title`) {clause}'
+
     def test_match_against_expression(self):
         """Test MySQLMatchAgainstExpression class."""
         dialect = MySQLDialect(version=(8, 0, 0))
@@ -19,6 +19,10 @@ from rhosocial.activerecord.backend.impl.mysql.expression.json_table import (
     MySQLJSONTableExpression,
     JSONTableColumn,
 )
+from rhosocial.activerecord.backend.impl.mysql.expression import (
+    MySQLLoadDataExpression,
+    LoadDataOptions,
+)
 
 
 @pytest.fixture
@@ -56,6 +60,32 @@ def test_mysql_format_column_definition_comment_string_escaping(dialect):
     assert "Comment with ''single quote''" in sql
 
 
+def test_mysql_format_column_definition_keyword_constraints(dialect):
+    """Test fixed-keyword constraints render in declaration order."""
+    col_def = ColumnDefinition(
+        name="id",
+        data_type="INT",
+        constraints=[
+            ColumnConstraint(ColumnConstraintType.NOT_NULL, is_auto_increment=True),
+            ColumnConstraint(ColumnConstraintType.PRIMARY_KEY),
+            ColumnConstraint(ColumnConstraintType.UNIQUE),
+        ],
+    )
+
+    sql, params = dialect._format_column_definition_mysql(col_def, ColumnConstraintType)
+    assert sql == "`id` INT NOT NULL AUTO_INCREMENT PRIMARY KEY UNIQUE"
+    assert params == []
+
+
+def test_mysql_format_column_definition_bare_column(dialect):
+    """Test a column without constraints or comment renders as name and type."""
+    col_def = ColumnDefinition(name="note", data_type="TEXT")
+
+    sql, params = dialect._format_column_definition_mysql(col_def, ColumnConstraintType)
+    assert sql == "`note` TEXT"
+    assert params == []
+
+
 def test_mysql_escape_sql_string(dialect):
     """Test MySQL inherits _escape_sql_string."""
     result = dialect._escape_sql_string("Table's comment")
@@ -164,4 +194,51 @@ def test_mysql_format_cast_expression_valid(dialect):
 def test_mysql_format_cast_expression_rejects_injection(dialect):
     """Test that malicious target_type is rejected."""
     with pytest.raises(ValueError, match="Invalid target type"):
-        dialect.format_cast_expression("column", "INTEGER; DROP TABLE users--", (), None)
\ No newline at end of file
+        dialect.format_cast_expression("column", "INTEGER; DROP TABLE users--", (), None)
+
+
+def test_mysql_format_identifier_escapes_backticks(dialect):
+    """Test embedded backticks in identifiers are doubled."""
+    assert dialect.format_identifier("odd`name") == "`odd``name`"
+    assert dialect.format_identifier("plain") == "`plain`"
+
+
+def test_mysql_load_data_string_escaping(dialect):
+    """Test LOAD DATA file path and field options are escaped."""
+    expr = MySQLLoadDataExpression(
+        dialect=dialect,
+        file_path="/tmp/o'brien\\data.csv",
+        table="users",
+        options=LoadDataOptions(fields_enclosed_by="'"),
+    )
+
+    sql, params = dialect.format_load_data_statement(expr)
+
+    assert "INFILE '/tmp/o\\'brien\\\\data.csv'" in sql
+    assert "ENCLOSED BY '\\''" in sql
+    assert params == ()
+
+
+def test_mysql_format_identifier_is_memoized(dialect):
+    """Repeated identifiers come from the cache and stay correctly escaped."""
+    first = dialect.format_identifier("cache`probe")
+    assert first == "`cache``probe`"
+    assert dialect.format_identifier("cache`probe") is first
+
+
+def test_mysql_json_path_literal_is_memoized(dialect):
+    """Repeated JSON paths reuse one escaped, quoted literal."""
+    first = dialect._json_path_literal("$.o'brien")
+    assert first == "'$.o''brien'"
+    assert dialect._json_path_literal("$.o'brien") is first
+
+
+@pytest.mark.parametrize("limit, offset, expected", [
+    (None, None, (None, [])),
+    (20, None, ("LIMIT %s", [20])),
+    (20, 40, ("LIMIT %s OFFSET %s", [20, 40])),
+    (None, 40, ("LIMIT %s OFFSET %s", [18446744073709551615, 40])),
+])
+def test_mysql_format_limit_offset_binds_values(dialect, limit, offset, expected):
+    """LIMIT/OFFSET values are always bound, never interpolated."""
+    assert dialect.format_limit_offset(limit, offset) == expected
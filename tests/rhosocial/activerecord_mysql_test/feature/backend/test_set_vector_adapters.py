@@ -109,6 +109,25 @@ class TestMySQLVectorAdapterDecodeFromBytes:
         assert abs(result[1] - 2.0) < 1e-6
         assert abs(result[2] - 3.0) < 1e-6
 
+    def test_decode_binary_valid_utf8_floats(self):
+        """Test packed floats that happen to be valid UTF-8 decode as binary."""
+        adapter = MySQLVectorAdapter()
+        binary_data = struct.pack('<2f', 0.0, 0.0)
+        assert adapter._decode_vector_from_bytes(binary_data) == [0.0, 0.0]
+
+    def test_decode_binary_starting_with_bracket_byte(self):
+        """Test packed floats whose first byte is 0x5B ('[') decode as binary."""
+        adapter = MySQLVectorAdapter()
+        binary_data = bytes([0x5B, 0x00, 0x80, 0x3F]) + struct.pack('<f', 2.0)
+        expected = list(struct.unpack('<2f', binary_data))
+        assert adapter._decode_vector_from_bytes(binary_data) == expected
+
+    def test_decode_unbracketed_text_bytes(self):
+        """Test unbracketed text decodes as text, including lengths divisible by 4."""
+        adapter = MySQLVectorAdapter()
+        assert adapter._decode_vector_from_bytes(b'1.25,2.5') == [1.25, 2.5]
+        assert adapter._decode_vector_from_bytes(b'1.5,2') == [1.5, 2.0]
+
     def test_decode_binary_invalid_length_raises_error(self):
         """Test that invalid binary length raises ValueError."""
         adapter = MySQLVectorAdapter()
@@ -119,6 +138,22 @@ class TestMySQLVectorAdapterDecodeFromBytes:
             adapter._decode_vector_from_bytes(invalid_data)
 
 
+class TestMySQLVectorAdapterToDatabase:
+    """Tests for MySQLVectorAdapter.to_database."""
+
+    def test_formats_mixed_numbers_as_float_text(self):
+        """Test ints and floats are written as float text in one bracketed string."""
+        adapter = MySQLVectorAdapter()
+        assert adapter.to_database([1, 2.5, -3], str) == '[1.0,2.5,-3.0]'
+        assert adapter.to_database([0.5], bytes) == b'[0.5]'
+
+    def test_non_numeric_element_raises_error(self):
+        """Test that a non-numeric element is rejected with its index."""
+        adapter = MySQLVectorAdapter()
+        with pytest.raises(TypeError, match="index 1"):
+            adapter.to_database([1.0, '2.0'], str)
+
+
 class TestMySQLVectorAdapterDecodeFromString:
     """Tests for MySQLVectorAdapter._decode_vector_from_string method."""
 
@@ -190,3 +225,25 @@ class TestMySQLVectorAdapterFromDatabaseIntegration:
         adapter = MySQLVectorAdapter()
         result = adapter.from_database('[1.5,2.5,3.5]', list)
         assert result == [1.5, 2.5, 3.5]
+
+    def test_from_database_list_and_subclass_values(self):
+        """Test that lists and str subclasses resolve to the matching decoder."""
+        class VectorText(str):
+            pass
+
+        adapter = MySQLVectorAdapter()
+        assert adapter.from_database([1, 2], list) == [1.0, 2.0]
+        assert adapter.from_database(VectorText('[4.0]'), list) == [4.0]
+        with pytest.raises(TypeError):
+            adapter.from_database(42, list)
+
+    def test_from_database_caches_subclass_decoder(self):
+        """Test that a subclass resolves its decoder once and caches it."""
+        class VectorBytes(bytes):
+            pass
+
+        adapter = MySQLVectorAdapter()
+        assert VectorBytes not in adapter._decoders
+        assert adapter.from_database(VectorBytes(b'[1.0]'), list) == [1.0]
+        assert adapter._decoders[VectorBytes] == adapter._decode_vector_from_bytes
+        assert adapter.from_database(VectorBytes(b'[2.0]'), list) == [2.0]
@@ -0,0 +1,36 @@
+# tests/rhosocial/activerecord_mysql_test/feature/backend/test_transaction_isolation_sql.py
+"""
+Tests for the SET TRANSACTION ISOLATION LEVEL statements built by
+MySQLTransactionMixin.
+
+These tests do not require a database connection.
+"""
+import pytest
+
+from rhosocial.activerecord.backend.impl.mysql.mixins import MySQLTransactionMixin
+from rhosocial.activerecord.backend.transaction import IsolationLevel, IsolationLevelError
+
+
+def test_build_set_isolation_sql():
+    """Each supported level maps to its SET TRANSACTION statement."""
+    mixin = MySQLTransactionMixin()
+    assert mixin._build_set_isolation_sql(IsolationLevel.READ_COMMITTED) == (
+        "SET TRANSACTION ISOLATION LEVEL READ COMMITTED", ()
+    )
+    assert mixin._build_set_isolation_sql(IsolationLevel.SERIALIZABLE) == (
+        "SET TRANSACTION ISOLATION LEVEL SERIALIZABLE", ()
+    )
+
+
+def test_build_set_isolation_sql_honors_subclass_levels():
+    """A subclass overriding _ISOLATION_LEVELS gets statements from its own table."""
+    class RestrictedMixin(MySQLTransactionMixin):
+        _ISOLATION_LEVELS = {IsolationLevel.SERIALIZABLE: "SERIALIZABLE"}
+
+    MySQLTransactionMixin()._build_set_isolation_sql(IsolationLevel.READ_COMMITTED)
+    restricted = RestrictedMixin()
+    assert restricted._build_set_isolation_sql(IsolationLevel.SERIALIZABLE) == (
+        "SET TRANSACTION ISOLATION LEVEL SERIALIZABLE", ()
+    )
+    with pytest.raises(IsolationLevelError):
+        restricted._build_set_isolation_sql(IsolationLevel.READ_COMMITTED)